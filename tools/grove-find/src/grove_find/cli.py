@@ -3,16 +3,81 @@
 Provides the `gf` command with subcommands for codebase search.
 """
 
-from typing import Optional
+import importlib
+from typing import Any, Optional
+
 import typer
+import typer.core
 
 from grove_find import __version__
-from grove_find.core.config import Config, set_config, OutputMode
-from grove_find.core.tools import discover_tools, get_install_instructions
-from grove_find.output import print_error, print_warning, print_success
 
-# Import command modules (will be added as we implement them)
-from grove_find.commands import search, files, git, github, cloudflare, quality, project
+# Subcommand groups, registered by import path so `gf --help` and simple
+# top-level commands never pay for importing every command module.
+# Help strings are kept inline here so the help path stays import-free.
+_LAZY_GROUPS: dict[str, tuple[str, str, bool]] = {
+    "files": ("grove_find.commands.files", "File type searches", True),
+    "git": ("grove_find.commands.git", "Git operations", False),
+    "github": ("grove_find.commands.github", "GitHub issue commands", False),
+    "cf": ("grove_find.commands.cloudflare", "Cloudflare bindings", False),
+    "quality": ("grove_find.commands.quality", "Code quality commands", True),
+    "project": ("grove_find.commands.project", "Project health commands", True),
+}
+
+
+class _LazySubgroup(typer.core.TyperGroup):
+    """Placeholder for a command group that imports its module on demand.
+
+    Carries the name/help/hidden flags needed for `gf --help`, and delegates
+    everything else to the real group, imported only when dispatched into.
+    """
+
+    def __init__(self, name: str, import_path: str, help_text: str, hidden: bool):
+        super().__init__(name=name, help=help_text, short_help=help_text, hidden=hidden)
+        self._import_path = import_path
+        self._real: Optional[Any] = None
+
+    def _load(self) -> Any:
+        if self._real is None:
+            module = importlib.import_module(self._import_path)
+            self._real = typer.main.get_command(module.app)
+            self._real.name = self.name
+        return self._real
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return self._load().list_commands(ctx)
+
+    def get_command(self, ctx: typer.Context, name: str) -> Optional[Any]:
+        return self._load().get_command(ctx, name)
+
+    def parse_args(self, ctx: typer.Context, args: list[str]) -> list[str]:
+        return self._load().parse_args(ctx, args)
+
+    def invoke(self, ctx: typer.Context) -> Any:
+        return self._load().invoke(ctx)
+
+    def get_help(self, ctx: typer.Context) -> str:
+        return self._load().get_help(ctx)
+
+
+class LazyTyperGroup(typer.core.TyperGroup):
+    """TyperGroup that resolves registered subgroups lazily by import path."""
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return super().list_commands(ctx) + list(_LAZY_GROUPS)
+
+    def get_command(self, ctx: typer.Context, name: str) -> Optional[Any]:
+        cmd = super().get_command(ctx, name)
+        if cmd is not None:
+            return cmd
+        entry = _LAZY_GROUPS.get(name)
+        if entry is None:
+            return None
+        import_path, help_text, hidden = entry
+        placeholder = _LazySubgroup(name, import_path, help_text, hidden)
+        # Cache so repeated lookups (help rendering, dispatch) share one instance
+        self.commands[name] = placeholder
+        return placeholder
+
 
 # Create the main Typer app
 app = typer.Typer(
@@ -21,6 +86,7 @@ app = typer.Typer(
     no_args_is_help=True,  # Show help when no command given
     rich_markup_mode="rich",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
 
@@ -81,6 +147,12 @@ def main(
         gf github issue 42     View GitHub issue #42
         gf git blame file.ts   Show git blame for a file
     """
+    # Deferred so eager options like --version exit before paying for
+    # config detection and tool discovery
+    from grove_find.core.config import Config, set_config
+    from grove_find.core.tools import discover_tools, get_install_instructions
+    from grove_find.output import print_error, print_warning
+
     # Initialize configuration
     try:
         config = Config.from_env_and_cwd(
@@ -116,13 +188,7 @@ def main(
     ctx.obj["tools"] = tools
 
 
-# Register command groups
-app.add_typer(files.app, name="files", help="File type searches", hidden=True)
-app.add_typer(git.app, name="git", help="Git operations")
-app.add_typer(github.app, name="github", help="GitHub issue commands")
-app.add_typer(cloudflare.app, name="cf", help="Cloudflare bindings")
-app.add_typer(quality.app, name="quality", help="Code quality commands", hidden=True)
-app.add_typer(project.app, name="project", help="Project health commands", hidden=True)
+# Command groups are registered lazily via _LAZY_GROUPS / LazyTyperGroup above.
 
 
 # Primary search command at top level
@@ -1 +1,21 @@
-"""Command modules for grove-find."""
+"""Command modules for grove-find.
+
+Submodules are loaded lazily via PEP 562 so that importing the package
+(or one command module) never drags in the rest.
+"""
+
+import importlib
+
+_SUBMODULES = frozenset(
+    {"search", "files", "git", "github", "cloudflare", "quality", "project"}
+)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(_SUBMODULES)
@@ -3,8 +3,12 @@
 Provides: gf cf, gf cf d1, gf cf kv, gf cf r2, gf cf do
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
+import re
+import subprocess
 import typer
 
 from grove_find.core.config import get_config
@@ -13,23 +17,125 @@ from grove_find.output import console, print_section, print_warning
 
 app = typer.Typer(help="Cloudflare bindings")
 
+# Overview sections: (title, pattern, compiled matcher, empty-result
+# message). The patterns are combined into a single ripgrep run and lines
+# are bucketed per section with the precompiled matchers.
+_OVERVIEW_SECTIONS = [
+    (title, pattern, re.compile(pattern), empty_msg)
+    for title, pattern, empty_msg in [
+        ("D1 Database", r"platform\.env\.DB|D1Database", "no D1 usage found"),
+        ("KV Namespaces", r"KVNamespace|platform\.env\.\w*KV", "no KV usage found"),
+        ("R2 Buckets", r"R2Bucket|platform\.env\.\w*BUCKET", "no R2 usage found"),
+        ("Durable Objects", r"DurableObject|\.idFromName\(", "no DO usage found"),
+    ]
+]
+
+# Preformatted rg flag tuples, assembled once instead of per call site
+_TS_JS_TYPES = ("--type", "ts", "--type", "js")
+_EXCLUDE_GLOBS = ("--glob", "!node_modules", "--glob", "!.git", "--glob", "!dist")
+
+# Strips ANSI color codes so bucketing works on human-mode (colored) output
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Keywords that mark a matching line as relevant to each binding type,
+# precompiled at module load as (frozenset, rg alternation) pairs
+def _compile_keywords(*keywords: str) -> tuple[frozenset[str], str]:
+    return frozenset(keywords), "|".join(keywords)
+
+
+_KV_KEYWORDS = _compile_keywords("kv", "namespace", "cache", "session")
+_R2_KEYWORDS = _compile_keywords("r2", "bucket", "storage", "upload", "blob")
+_DO_KEYWORDS = _compile_keywords("durable", "do", "stub", "idfrom")
+
+
+def _keyword_pattern(pattern: str, keywords: tuple[frozenset[str], str]) -> str:
+    """Build an rg pattern requiring both the user pattern and a keyword.
+
+    Lets ripgrep do the relevance filtering that was previously a Python
+    loop over every matching line.
+    """
+    keyword_set, alts = keywords
+    if any(kw in pattern.lower() for kw in keyword_set):
+        # Pattern already implies relevance; no second condition needed
+        return pattern
+    return f"(?i:{alts}).*(?:{pattern})|(?:{pattern}).*(?i:{alts})"
 
-def _run_rg(args: list[str], cwd: Path) -> str:
-    """Run ripgrep with standard options."""
-    tools = discover_tools()
-    if not tools.rg:
-        raise typer.Exit(1)
 
+def _rg_base_args() -> list[str]:
+    """Standard ripgrep options shared by all cf searches."""
     config = get_config()
     base_args = ["--line-number", "--no-heading", "--smart-case"]
-    excludes = ["--glob", "!node_modules", "--glob", "!.git", "--glob", "!dist"]
 
     if config.is_human_mode:
         base_args.append("--color=always")
     else:
         base_args.append("--color=never")
 
-    result = run_tool(tools.rg, base_args + excludes + args, cwd=cwd)
+    return base_args + list(_EXCLUDE_GLOBS)
+
+
+# Identical queries within one invocation share a result — a gf run never
+# mutates the tree, so re-spawning rg for the same args is pure overhead
+_rg_memo: dict[tuple[str, ...], str] = {}
+
+
+def _run_rg(args: list[str], cwd: Path) -> str:
+    """Run ripgrep with standard options. Results are memoized per invocation."""
+    tools = discover_tools()
+    if not tools.rg:
+        raise typer.Exit(1)
+
+    key = (str(cwd), *args)
+    cached = _rg_memo.get(key)
+    if cached is not None:
+        return cached
+
+    result = run_tool(tools.rg, _rg_base_args() + args, cwd=cwd)
+    _rg_memo[key] = result.stdout
+    return result.stdout
+
+
+def _run_rg_capped(args: list[str], cwd: Path, limit: int) -> list[str]:
+    """Run ripgrep, streaming at most `limit` matching lines.
+
+    Stops reading (and terminates rg) once the display cap is reached,
+    instead of buffering the full match set and slicing in Python.
+    """
+    tools = discover_tools()
+    if not tools.rg:
+        raise typer.Exit(1)
+
+    proc = subprocess.Popen(
+        [str(tools.rg)] + _rg_base_args() + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert proc.stdout is not None
+    lines = [line.rstrip("\n") for line in islice(proc.stdout, limit)]
+    proc.stdout.close()
+    proc.terminate()
+    proc.wait()
+    return lines
+
+
+_fd_memo: dict[tuple[str, ...], str] = {}
+
+
+def _run_fd(args: list[str], cwd: Path) -> str:
+    """Run fd, memoized per invocation. Returns "" when fd is not installed."""
+    tools = discover_tools()
+    if not tools.fd:
+        return ""
+
+    key = (str(cwd), *args)
+    cached = _fd_memo.get(key)
+    if cached is not None:
+        return cached
+
+    result = run_tool(tools.fd, args, cwd=cwd)
+    _fd_memo[key] = result.stdout
     return result.stdout
 
 
@@ -42,81 +148,30 @@ def cf_default(ctx: typer.Context) -> None:
 
         print_section("Cloudflare Bindings Overview", "")
 
-        # D1
-        print_section("D1 Database", "")
+        # One ripgrep pass over the tree with all section patterns combined,
+        # then bucket the matches per section in Python
+        combined = "|".join(pattern for _, pattern, _, _ in _OVERVIEW_SECTIONS)
         output = _run_rg(
             [
-                "platform\\.env\\.DB|D1Database",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
+                combined,
+                *_TS_JS_TYPES,
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
-        if output:
-            lines = output.strip().split("\n")[:15]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (no D1 usage found)")
+        all_lines = output.strip().split("\n") if output.strip() else []
 
-        # KV
-        print_section("KV Namespaces", "")
-        output = _run_rg(
-            [
-                "KVNamespace|platform\\.env\\.\\w*KV",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
-            ],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:15]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (no KV usage found)")
-
-        # R2
-        print_section("R2 Buckets", "")
-        output = _run_rg(
-            [
-                "R2Bucket|platform\\.env\\.\\w*BUCKET",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
-            ],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:15]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (no R2 usage found)")
-
-        # DO
-        print_section("Durable Objects", "")
-        output = _run_rg(
-            [
-                "DurableObject|\\.idFromName\\(",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
-            ],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:15]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (no DO usage found)")
+        for title, _pattern, section_re, empty_msg in _OVERVIEW_SECTIONS:
+            print_section(title, "")
+            lines = [
+                line
+                for line in all_lines
+                if section_re.search(_ANSI_RE.sub("", line))
+            ][:15]
+            if lines:
+                console.print_raw("\n".join(lines))
+            else:
+                console.print(f"  ({empty_msg})")
 
 
 @app.command("d1")
@@ -134,11 +189,8 @@ def d1_cmd(
         output = _run_rg(
             [
                 f"(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP).*{pattern}",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
+                *_TS_JS_TYPES,
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
@@ -158,7 +210,7 @@ def d1_cmd(
                 "*schema*",
                 "--glob",
                 "*migration*",
-                str(config.grove_root),
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
@@ -169,72 +221,81 @@ def d1_cmd(
     else:
         print_section("D1 Database Usage", "")
 
+        # The four queries are independent; run them concurrently and
+        # print the sections in order once all have landed
+        tools = discover_tools()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            bindings_future = pool.submit(
+                _run_rg_capped,
+                [
+                    "platform\\.env\\.DB|env\\.DB|D1Database",
+                    *_TS_JS_TYPES,
+                    config.root_str,
+                ],
+                cwd=config.grove_root,
+                limit=20,
+            )
+            ops_future = pool.submit(
+                _run_rg_capped,
+                [
+                    "\\.prepare\\(|\\.exec\\(|\\.batch\\(",
+                    *_TS_JS_TYPES,
+                    config.root_str,
+                ],
+                cwd=config.grove_root,
+                limit=30,
+            )
+            sql_future = (
+                pool.submit(
+                    _run_fd,
+                    ["--exclude", "node_modules", "-e", "sql", ".", config.root_str],
+                    cwd=config.grove_root,
+                )
+                if tools.fd
+                else None
+            )
+            wrangler_future = pool.submit(
+                _run_rg,
+                [
+                    "\\[\\[d1_databases\\]\\]",
+                    "-A",
+                    "5",
+                    "--glob",
+                    "wrangler*.toml",
+                    config.root_str,
+                ],
+                cwd=config.grove_root,
+            )
+
         # Bindings
         print_section("D1 Database Bindings", "")
-        output = _run_rg(
-            [
-                "platform\\.env\\.DB|env\\.DB|D1Database",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
-            ],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:20]
+        lines = bindings_future.result()
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # Query operations
         print_section("Query Operations", "")
-        output = _run_rg(
-            [
-                "\\.prepare\\(|\\.exec\\(|\\.batch\\(",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
-            ],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:30]
+        lines = ops_future.result()
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # SQL files
         print_section("SQL Files", "")
-        tools = discover_tools()
-        if tools.fd:
-            result = run_tool(
-                tools.fd,
-                ["--exclude", "node_modules", "-e", "sql", ".", str(config.grove_root)],
-                cwd=config.grove_root,
-            )
-            if result.stdout:
-                lines = result.stdout.strip().split("\n")[:20]
+        if sql_future is not None:
+            output = sql_future.result()
+            if output:
+                lines = output.strip().split("\n")[:20]
                 console.print_raw("\n".join(lines))
             else:
                 console.print("  (none found)")
 
         # Wrangler config
         print_section("Wrangler D1 Config", "")
-        output = _run_rg(
-            [
-                "\\[\\[d1_databases\\]\\]",
-                "-A",
-                "5",
-                "--glob",
-                "wrangler*.toml",
-                str(config.grove_root),
-            ],
-            cwd=config.grove_root,
-        )
+        output = wrangler_future.result()
         if output:
             console.print_raw(output.rstrip())
         else:
@@ -250,62 +311,50 @@ def kv_cmd(
 
     if pattern:
         print_section(f"KV usage matching: {pattern}", "")
-        output = _run_rg(
-            [pattern, "--type", "ts", "--type", "js", str(config.grove_root)],
+        lines = _run_rg_capped(
+            [
+                _keyword_pattern(pattern, _KV_KEYWORDS),
+                *_TS_JS_TYPES,
+                config.root_str,
+            ],
             cwd=config.grove_root,
+            limit=30,
         )
-        if output:
-            # Filter for KV-related
-            lines = [
-                l
-                for l in output.strip().split("\n")
-                if any(
-                    kw in l.lower() for kw in ["kv", "namespace", "cache", "session"]
-                )
-            ]
-            if lines:
-                console.print_raw("\n".join(lines[:30]))
-            else:
-                console.print("  (no KV-related matches)")
+        if lines:
+            console.print_raw("\n".join(lines))
         else:
-            console.print("  (no matches)")
+            console.print("  (no KV-related matches)")
     else:
         print_section("KV Namespace Usage", "")
 
         # Bindings
         print_section("KV Namespace Bindings", "")
-        output = _run_rg(
+        lines = _run_rg_capped(
             [
                 "KVNamespace|platform\\.env\\.\\w*KV|env\\.\\w*KV",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
+                *_TS_JS_TYPES,
+                config.root_str,
             ],
             cwd=config.grove_root,
+            limit=20,
         )
-        if output:
-            lines = output.strip().split("\n")[:20]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # Operations
         print_section("KV Operations", "")
-        output = _run_rg(
+        lines = _run_rg_capped(
             [
                 "\\w+KV\\.(get|put|delete|list|getWithMetadata)\\(",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
+                *_TS_JS_TYPES,
+                config.root_str,
             ],
             cwd=config.grove_root,
+            limit=30,
         )
-        if output:
-            lines = output.strip().split("\n")[:30]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
@@ -319,7 +368,7 @@ def kv_cmd(
                 "5",
                 "--glob",
                 "wrangler*.toml",
-                str(config.grove_root),
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
@@ -338,62 +387,50 @@ def r2_cmd(
 
     if pattern:
         print_section(f"R2 usage matching: {pattern}", "")
-        output = _run_rg(
-            [pattern, "--type", "ts", "--type", "js", str(config.grove_root)],
+        lines = _run_rg_capped(
+            [
+                _keyword_pattern(pattern, _R2_KEYWORDS),
+                *_TS_JS_TYPES,
+                config.root_str,
+            ],
             cwd=config.grove_root,
+            limit=30,
         )
-        if output:
-            lines = [
-                l
-                for l in output.strip().split("\n")
-                if any(
-                    kw in l.lower()
-                    for kw in ["r2", "bucket", "storage", "upload", "blob"]
-                )
-            ]
-            if lines:
-                console.print_raw("\n".join(lines[:30]))
-            else:
-                console.print("  (no R2-related matches)")
+        if lines:
+            console.print_raw("\n".join(lines))
         else:
-            console.print("  (no matches)")
+            console.print("  (no R2-related matches)")
     else:
         print_section("R2 Storage Usage", "")
 
         # Bindings
         print_section("R2 Bucket Bindings", "")
-        output = _run_rg(
+        lines = _run_rg_capped(
             [
                 "R2Bucket|platform\\.env\\.\\w*BUCKET|env\\.\\w*BUCKET",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
+                *_TS_JS_TYPES,
+                config.root_str,
             ],
             cwd=config.grove_root,
+            limit=20,
         )
-        if output:
-            lines = output.strip().split("\n")[:20]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # Operations
         print_section("R2 Operations", "")
-        output = _run_rg(
+        lines = _run_rg_capped(
             [
                 "bucket\\.(put|get|head|delete|list)\\(",
-                "--type",
-                "ts",
-                "--type",
-                "js",
-                str(config.grove_root),
+                *_TS_JS_TYPES,
+                config.root_str,
             ],
             cwd=config.grove_root,
+            limit=30,
         )
-        if output:
-            lines = output.strip().split("\n")[:30]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
@@ -407,7 +444,7 @@ def r2_cmd(
                 "5",
                 "--glob",
                 "wrangler*.toml",
-                str(config.grove_root),
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
@@ -426,22 +463,19 @@ def do_cmd(
 
     if name:
         print_section(f"Durable Objects matching: {name}", "")
-        output = _run_rg(
-            [name, "--type", "ts", "--type", "js", str(config.grove_root)],
+        lines = _run_rg_capped(
+            [
+                _keyword_pattern(name, _DO_KEYWORDS),
+                *_TS_JS_TYPES,
+                config.root_str,
+            ],
             cwd=config.grove_root,
+            limit=30,
         )
-        if output:
-            lines = [
-                l
-                for l in output.strip().split("\n")
-                if any(kw in l.lower() for kw in ["durable", "do", "stub", "idfrom"])
-            ]
-            if lines:
-                console.print_raw("\n".join(lines[:30]))
-            else:
-                console.print("  (no DO-related matches)")
+        if lines:
+            console.print_raw("\n".join(lines))
         else:
-            console.print("  (no matches)")
+            console.print("  (no DO-related matches)")
     else:
         print_section("Durable Objects", "")
 
@@ -452,7 +486,7 @@ def do_cmd(
                 "export\\s+class\\s+\\w+.*implements\\s+DurableObject|extends\\s+DurableObject",
                 "--type",
                 "ts",
-                str(config.grove_root),
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
@@ -465,8 +499,7 @@ def do_cmd(
         print_section("DO Files (by naming)", "")
         tools = discover_tools()
         if tools.fd:
-            result = run_tool(
-                tools.fd,
+            output = _run_fd(
                 [
                     "--exclude",
                     "node_modules",
@@ -474,29 +507,29 @@ def do_cmd(
                     "do\\.|durable",
                     "-e",
                     "ts",
-                    str(config.grove_root),
+                    config.root_str,
                 ],
                 cwd=config.grove_root,
             )
-            if result.stdout:
-                lines = result.stdout.strip().split("\n")[:20]
+            if output:
+                lines = output.strip().split("\n")[:20]
                 console.print_raw("\n".join(lines))
             else:
                 console.print("  (none found)")
 
         # Stub usage
         print_section("DO Stub Usage", "")
-        output = _run_rg(
+        lines = _run_rg_capped(
             [
                 "\\.idFromName\\(|\\.idFromString\\(|\\.get\\(.*DurableObjectId",
                 "--type",
                 "ts",
-                str(config.grove_root),
+                config.root_str,
             ],
             cwd=config.grove_root,
+            limit=20,
         )
-        if output:
-            lines = output.strip().split("\n")[:20]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
@@ -510,7 +543,7 @@ def do_cmd(
                 "10",
                 "--glob",
                 "wrangler*.toml",
-                str(config.grove_root),
+                config.root_str,
             ],
             cwd=config.grove_root,
         )
@@ -6,17 +6,138 @@ Also: gf test, gf config
 When fd is not installed, falls back to `rg --files` with glob patterns.
 """
 
+import fnmatch
+import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 import typer
 
 from grove_find.core.config import get_config
-from grove_find.core.tools import discover_tools, run_tool
+from grove_find.core.tools import discover_tools
+from grove_find.core.walk import iter_files
 from grove_find.output import console, print_section, print_warning
 
 app = typer.Typer(help="File type searches")
 
+# Config-ish path heuristic for the named `gf config <name>` filter; compiled
+# once so the per-line check runs in C instead of lowercasing each line
+_CONFIG_KW_RE = re.compile(r"config|rc|\.toml|\.json|\.ya?ml", re.IGNORECASE)
+
+# Test-file naming convention, compiled once at import
+_TEST_FILE_RE = re.compile(r"\.(test|spec)\.(ts|js)$")
+
+# Config-file categories: (title, filename regex, compiled matcher). One
+# combined fd/rg walk finds all of them; results are bucketed per category.
+_CONFIG_SECTIONS = [
+    (title, pattern, re.compile(pattern))
+    for title, pattern in [
+        (
+            "Build & Bundler Configs",
+            r"(vite|svelte|tailwind|postcss|tsconfig|jsconfig)\.config\.(js|ts|mjs)$",
+        ),
+        ("Wrangler Configs", r"wrangler[^/]*\.toml$"),
+        ("Package Configs", r"package\.json$"),
+        ("TypeScript Configs", r"tsconfig[^/]*\.json$"),
+    ]
+]
+
+
+def _head_lines(s: str, n: int) -> tuple[str, bool]:
+    """First n lines of s as a slice, plus whether s had more.
+
+    Scans for the n-th newline with str.find instead of tokenizing the
+    whole listing into a list just to display a prefix.
+    """
+    pos = -1
+    for _ in range(n):
+        pos = s.find("\n", pos + 1)
+        if pos == -1:
+            return s, False
+    return s[:pos], len(s) > pos + 1
+
+
+# Per-invocation cache of full `rg --files` listings, keyed by cwd. The
+# fallback path re-walks the same root for every regex; one CLI run only
+# needs the listing once.
+_ls_memo: dict[str, bytes] = {}
+
+
+def _rg_files_listing(cwd: Path) -> bytes:
+    """Raw `rg --files` listing for cwd, memoized per invocation.
+
+    Kept as bytes: callers filter with bytes patterns and decode only
+    the surviving lines, skipping UTF-8 decode on paths that are about
+    to be discarded anyway.
+    """
+    key = str(cwd)
+    if key not in _ls_memo:
+        tools = discover_tools()
+        result = subprocess.run(
+            [str(tools.rg), "--files", "--sort", "path", key],
+            cwd=cwd,
+            capture_output=True,
+        )
+        _ls_memo[key] = result.stdout
+    return _ls_memo[key]
+
+
+# Per-invocation cache of common fd flags, keyed by cwd
+_fd_args_memo: dict[str, list[str]] = {}
+
+
+def _fd_base_args(cwd: Path) -> list[str]:
+    """Common fd flags for cwd, computed once per invocation.
+
+    fd honors .gitignore, so when the repo's own ignore file already
+    covers node_modules and dist the explicit --exclude globs are
+    redundant matchers fd would run per directory entry — skip them.
+    Also sizes fd's thread pool explicitly instead of letting it guess.
+    """
+    key = str(cwd)
+    if key not in _fd_args_memo:
+        args = ["--exclude", ".git", "--color=never", "-j", str(min(8, os.cpu_count() or 4))]
+        try:
+            ignore = (cwd / ".gitignore").read_text()
+            covered = "node_modules" in ignore and "dist" in ignore
+        except OSError:
+            covered = False
+        if not covered:
+            args[:0] = ["--exclude", "node_modules", "--exclude", "dist"]
+        _fd_args_memo[key] = args
+    return _fd_args_memo[key]
+
+
+def _stream_tool_lines(
+    tool_path: Path,
+    args: list[str],
+    cwd: Path,
+    limit: int,
+) -> list[str]:
+    """Run a tool and read at most `limit` + 1 lines, terminating it early.
+
+    Listing commands only ever display `limit` results; streaming lets
+    fd/rg stop walking as soon as the cap is hit instead of enumerating
+    (and us buffering) the whole tree. The extra line tells callers
+    whether output was truncated.
+    """
+    proc = subprocess.Popen(
+        [str(tool_path)] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert proc.stdout is not None
+    lines = [line.rstrip("\n") for line in islice(proc.stdout, limit + 1)]
+    proc.stdout.close()
+    proc.terminate()
+    proc.wait()
+    return lines
+
 
 def _find_files(
     extensions: list[str],
@@ -35,15 +156,10 @@ def _find_files(
         limit: Max results before truncating
     """
     tools = discover_tools()
-    config = get_config()
 
     if tools.fd:
         # Preferred: use fd
-        args = ["--exclude", "node_modules", "--exclude", "dist", "--exclude", ".git"]
-        if config.is_human_mode:
-            args.append("--color=always")
-        else:
-            args.append("--color=never")
+        args = list(_fd_base_args(cwd))
         for ext in extensions:
             args.extend(["-e", ext])
         if excludes:
@@ -54,75 +170,133 @@ def _find_files(
         else:
             args.append(".")
         args.append(str(cwd))
-        result = run_tool(tools.fd, args, cwd=cwd)
-        output = result.stdout
+        lines = _stream_tool_lines(tools.fd, args, cwd=cwd, limit=limit)
+    elif tools.rg:
+        if pattern:
+            # Python-side filter needs the full listing before capping;
+            # reuse the memoized walk shared with _find_files_regex
+            raw = _rg_files_listing(cwd).split(b"\n")
+            suffixes = tuple(f".{ext}".encode() for ext in extensions)
+            rx = re.compile(re.escape(pattern).encode(), re.IGNORECASE)
+            survivors = (
+                l.decode() for l in raw if l and l.endswith(suffixes) and rx.search(l)
+            )
+            if excludes:
+                lines = [
+                    p
+                    for p in survivors
+                    if not any(fnmatch.fnmatch(os.path.basename(p), e) for e in excludes)
+                ]
+            else:
+                lines = list(survivors)
+        else:
+            # Fallback: use rg --files with glob patterns, streamed
+            args = ["--files", "--sort", "path"]
+            for ext in extensions:
+                args.extend(["-g", f"*.{ext}"])
+            if excludes:
+                for exc in excludes:
+                    args.extend(["-g", f"!{exc}"])
+            args.append(str(cwd))
+            lines = _stream_tool_lines(tools.rg, args, cwd=cwd, limit=limit)
     else:
-        # Fallback: use rg --files with glob patterns
-        args = ["--files", "--sort", "path"]
-        for ext in extensions:
-            args.extend(["-g", f"*.{ext}"])
+        # Last resort: in-process scandir walk (no fd or rg on PATH)
+        suffixes = tuple(f".{ext}" for ext in extensions)
+        paths = iter_files(cwd, suffixes)
+        if pattern:
+            rx = re.compile(re.escape(pattern), re.IGNORECASE)
+            paths = (p for p in paths if rx.search(p))
         if excludes:
-            for exc in excludes:
-                args.extend(["-g", f"!{exc}"])
-        args.append(str(cwd))
-        result = run_tool(tools.rg, args, cwd=cwd)
-        output = result.stdout
-        # If pattern specified, filter the results
-        if pattern and output:
-            lines = output.strip().split("\n")
-            filtered = [l for l in lines if pattern.lower() in l.lower()]
-            output = "\n".join(filtered) + "\n" if filtered else ""
-
-    lines = output.strip().split("\n") if output.strip() else []
+            exc = tuple(excludes)
+            paths = (
+                p
+                for p in paths
+                if not any(fnmatch.fnmatch(os.path.basename(p), e) for e in exc)
+            )
+        lines = list(islice(paths, limit + 1))
+
+    if len(lines) > limit:
+        return "\n".join(lines[:limit]) + f"\n\n(Showing first {limit} results. Add a pattern to filter.)"
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _find_files_single(
+    extension: str,
+    cwd: Path,
+    pattern: Optional[str] = None,
+    excludes: Optional[list[str]] = None,
+    limit: int = 50,
+) -> str:
+    """Fast path of _find_files for the common single-extension case.
+
+    Every `gf <lang>` command except yaml and shell searches exactly one
+    extension; build the fd argument list with direct appends and skip
+    the generic loops. Fallback backends delegate to _find_files.
+    """
+    tools = discover_tools()
+    if not tools.fd:
+        return _find_files([extension], cwd, pattern=pattern, excludes=excludes, limit=limit)
+
+    args = list(_fd_base_args(cwd))
+    args += ["-e", extension]
+    if excludes:
+        for exc in excludes:
+            args += ["--exclude", exc]
+    args.append(pattern if pattern else ".")
+    args.append(str(cwd))
+    lines = _stream_tool_lines(tools.fd, args, cwd=cwd, limit=limit)
     if len(lines) > limit:
         return "\n".join(lines[:limit]) + f"\n\n(Showing first {limit} results. Add a pattern to filter.)"
-    return output
+    return "\n".join(lines) + "\n" if lines else ""
 
 
 def _find_files_regex(
-    regex: str,
+    regex: str | re.Pattern[str],
     cwd: Path,
     limit: int = 50,
 ) -> str:
     """Find files matching a regex pattern using fd or rg --files.
 
     Args:
-        regex: Regex pattern for fd, or translated to globs for rg
+        regex: Regex pattern (string or precompiled) for fd, or applied
+            as a Python-side filter for the rg fallback
         cwd: Working directory
         limit: Max results
     """
     tools = discover_tools()
-    config = get_config()
+
+    if isinstance(regex, re.Pattern):
+        compiled: Optional[re.Pattern[str]] = regex
+        regex = regex.pattern
+    else:
+        compiled = None
 
     if tools.fd:
-        args = ["--exclude", "node_modules", "--exclude", "dist", "--exclude", ".git"]
-        if config.is_human_mode:
-            args.append("--color=always")
-        else:
-            args.append("--color=never")
+        args = list(_fd_base_args(cwd))
         args.extend([regex, str(cwd)])
-        result = run_tool(tools.fd, args, cwd=cwd)
-        output = result.stdout
+        lines = _stream_tool_lines(tools.fd, args, cwd=cwd, limit=limit)
+    elif tools.rg:
+        # Fallback: filter the (memoized) full listing with grep-style matching
+        raw = _rg_files_listing(cwd).split(b"\n")
+        try:
+            brx = re.compile(regex.encode())
+            lines = [l.decode() for l in raw if l and brx.search(l)]
+        except (re.error, UnicodeEncodeError):
+            needle = regex.encode()
+            lines = [l.decode() for l in raw if l and needle in l]
     else:
-        # Fallback: use rg --files then filter with grep-style matching
-        args = ["--files", "--sort", "path", str(cwd)]
-        result = run_tool(tools.rg, args, cwd=cwd)
-        if result.stdout:
-            import re
-            lines = result.stdout.strip().split("\n")
-            try:
+        # Last resort: in-process scandir walk (no fd or rg on PATH)
+        try:
+            if compiled is None:
                 compiled = re.compile(regex)
-                filtered = [l for l in lines if compiled.search(l)]
-            except re.error:
-                filtered = [l for l in lines if regex in l]
-            output = "\n".join(filtered) + "\n" if filtered else ""
-        else:
-            output = ""
+            paths = (p for p in iter_files(cwd) if compiled.search(p))
+        except re.error:
+            paths = (p for p in iter_files(cwd) if regex in p)
+        lines = list(islice(paths, limit + 1))
 
-    lines = output.strip().split("\n") if output.strip() else []
     if len(lines) > limit:
         return "\n".join(lines[:limit]) + f"\n\n(Showing first {limit} results.)"
-    return output
+    return "\n".join(lines) + "\n" if lines else ""
 
 
 def _find_dirs(
@@ -140,35 +314,31 @@ def _find_dirs(
     tools = discover_tools()
 
     if tools.fd:
-        config = get_config()
-        args = ["--exclude", "node_modules", "--exclude", "dist", "--exclude", ".git"]
-        if config.is_human_mode:
-            args.append("--color=always")
-        else:
-            args.append("--color=never")
+        args = list(_fd_base_args(cwd))
         args.extend(["-t", "d", pattern, str(cwd)])
-        result = run_tool(tools.fd, args, cwd=cwd)
-        output = result.stdout
+        lines = _stream_tool_lines(tools.fd, args, cwd=cwd, limit=limit)
     else:
-        # Fallback: use find
-        result = subprocess.run(
+        # Fallback: use find. Prune excluded trees so find never descends
+        # into them, and anchor the regex to the final path component.
+        # Streamed like the fd branch, so enumeration stops at the cap.
+        lines = _stream_tool_lines(
+            Path("find"),
             [
-                "find", str(cwd),
-                "-type", "d",
+                str(cwd),
                 "-regextype", "posix-extended",
-                "-regex", f".*({pattern})",
-                "-not", "-path", "*/node_modules/*",
-                "-not", "-path", "*/.git/*",
-                "-not", "-path", "*/dist/*",
+                "(", "-name", "node_modules", "-o", "-name", ".git", "-o", "-name", "dist", ")",
+                "-prune", "-o",
+                "-type", "d",
+                "-iregex", f".*/({pattern})$",
+                "-print",
             ],
-            capture_output=True, text=True, cwd=cwd,
+            cwd=cwd,
+            limit=limit,
         )
-        output = result.stdout
 
-    lines = output.strip().split("\n") if output.strip() else []
     if len(lines) > limit:
         return "\n".join(lines[:limit])
-    return output
+    return "\n".join(lines) + "\n" if lines else ""
 
 
 def _file_search(
@@ -185,8 +355,8 @@ def _file_search(
     else:
         print_section(description, "")
 
-    output = _find_files(
-        extensions=[extension],
+    output = _find_files_single(
+        extension,
         cwd=config.grove_root,
         pattern=pattern,
         excludes=excludes,
@@ -366,32 +536,56 @@ def test_command(name: Optional[str] = None) -> None:
     else:
         print_section("Test files", "")
 
-    output = _find_files_regex(
-        regex=r"\.(test|spec)\.(ts|js)$",
-        cwd=config.grove_root,
-    )
-    output = output.strip()
+    # Push the name filter into the search regex so fd/rg never emit
+    # non-matching lines, instead of post-filtering in Python
+    if name:
+        file_part = rf"(?i:{re.escape(name)}.*)\.(test|spec)\.(ts|js)$"
+    else:
+        file_part = r"\.(test|spec)\.(ts|js)$"
 
-    if name and output:
-        lines = [line for line in output.split("\n") if name.lower() in line.lower()]
-        if lines:
-            console.print_raw("\n".join(lines[:30]))
-        else:
-            print_warning("No matching test files found")
-    elif output:
-        lines = output.split("\n")
-        console.print_raw("\n".join(lines[:30]))
-        if len(lines) > 30:
-            console.print(f"\n(Showing first 30 of {len(lines)} test files)")
+    tools = discover_tools()
+    if tools.fd:
+        # One fd walk emits both test files and test directories; classify
+        # each line in Python instead of traversing the tree twice
+        combined = rf"({file_part})|((^|/)(test|tests|__tests__)$)"
+        args = _fd_base_args(config.grove_root) + [
+            "-t", "f", "-t", "d",
+            combined, str(config.grove_root),
+        ]
+        raw = _stream_tool_lines(tools.fd, args, cwd=config.grove_root, limit=100)
+        output = "\n".join(l for l in raw if _TEST_FILE_RE.search(l))
+        dir_output = "\n".join(l for l in raw if not _TEST_FILE_RE.search(l))
+    else:
+        # The file search and the directory search are independent
+        # subprocess walks; run them concurrently so wall time is max()
+        # not sum()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            files_future = pool.submit(
+                _find_files_regex,
+                regex=file_part if name else _TEST_FILE_RE,
+                cwd=config.grove_root,
+            )
+            dirs_future = pool.submit(
+                _find_dirs,
+                pattern=r"test|tests|__tests__",
+                cwd=config.grove_root,
+            )
+            output = files_future.result().strip()
+            dir_output = dirs_future.result()
+
+    if output:
+        head, truncated = _head_lines(output, 30)
+        console.print_raw(head)
+        if not name and truncated:
+            total = output.count("\n") + 1
+            console.print(f"\n(Showing first 30 of {total} test files)")
+    elif name:
+        print_warning("No matching test files found")
     else:
         print_warning("No test files found")
 
     # Also show test directories
     print_section("Test Directories", "")
-    dir_output = _find_dirs(
-        pattern=r"test|tests|__tests__",
-        cwd=config.grove_root,
-    )
     if dir_output.strip():
         lines = dir_output.strip().split("\n")
         console.print_raw("\n".join(lines[:20]))
@@ -423,14 +617,7 @@ def config_command(name: Optional[str] = None) -> None:
             cwd=config.grove_root,
         )
         if output.strip():
-            lines = [
-                line
-                for line in output.strip().split("\n")
-                if any(
-                    kw in line.lower()
-                    for kw in ["config", "rc", ".toml", ".json", ".yaml", ".yml"]
-                )
-            ]
+            lines = list(filter(_CONFIG_KW_RE.search, output.splitlines()))
             if lines:
                 console.print_raw("\n".join(lines))
             else:
@@ -438,49 +625,23 @@ def config_command(name: Optional[str] = None) -> None:
         else:
             print_warning("No matching config files found")
     else:
-        # Show categorized config files
-        print_section("Build & Bundler Configs", "")
+        # Show categorized config files: one combined walk, bucketed per
+        # category, instead of four separate fd/rg invocations
+        combined = "|".join(pattern for _, pattern, _ in _CONFIG_SECTIONS)
         output = _find_files_regex(
-            regex=r"(vite|svelte|tailwind|postcss|tsconfig|jsconfig)\.config\.(js|ts|mjs)",
+            regex=combined,
             cwd=config.grove_root,
+            limit=100,
         )
-        if output.strip():
-            console.print_raw(output.rstrip())
-        else:
-            console.print("  (none found)")
-
-        print_section("Wrangler Configs", "")
-        output = _find_files(
-            extensions=["toml"],
-            cwd=config.grove_root,
-            pattern="wrangler",
-        )
-        if output.strip():
-            console.print_raw(output.rstrip())
-        else:
-            console.print("  (none found)")
-
-        print_section("Package Configs", "")
-        output = _find_files_regex(
-            regex=r"package\.json$",
-            cwd=config.grove_root,
-        )
-        if output.strip():
-            lines = output.strip().split("\n")
-            console.print_raw("\n".join(lines[:20]))
-        else:
-            console.print("  (none found)")
+        all_lines = output.strip().split("\n") if output.strip() else []
 
-        print_section("TypeScript Configs", "")
-        output = _find_files(
-            extensions=["json"],
-            cwd=config.grove_root,
-            pattern="tsconfig",
-        )
-        if output.strip():
-            console.print_raw(output.rstrip())
-        else:
-            console.print("  (none found)")
+        for title, _pattern, section_re in _CONFIG_SECTIONS:
+            print_section(title, "")
+            lines = [line for line in all_lines if section_re.search(line)][:20]
+            if lines:
+                console.print_raw("\n".join(lines))
+            else:
+                console.print("  (none found)")
 
 
 @app.command("config")
@@ -3,16 +3,32 @@
 Provides: gf recent, gf changed, gf git blame, gf git history, gf git pickaxe, etc.
 """
 
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
+import re
+import subprocess
+import time
 import typer
 
 from grove_find.core.config import get_config
-from grove_find.core.tools import discover_tools, run_tool
+from grove_find.core.git_cache import cached_run_git
+from grove_find.core.tools import discover_tools, iter_tool_lines, run_tool
 from grove_find.output import console, print_header, print_section, print_warning
 
 app = typer.Typer(help="Git operations")
 
+# Noisy paths filtered out of log/diff listings. One precompiled
+# alternation replaces per-line chains of substring scans; the narrow
+# variant is for listings where generated 'dist' output can legitimately
+# appear.
+_EXCLUDE_RE = re.compile(r"node_modules|pnpm-lock|\.svelte-kit|dist")
+_EXCLUDE_RE_B = re.compile(rb"node_modules|pnpm-lock|\.svelte-kit|dist")
+_LOCKFILE_RE = re.compile(r"node_modules|pnpm-lock")
+
 
 def _run_git(args: list[str], cwd: Path) -> str:
     """Run git command."""
@@ -24,41 +40,156 @@ def _run_git(args: list[str], cwd: Path) -> str:
     return result.stdout
 
 
+# Per-invocation memo: sibling commands (changed, pr, wip, branches) each
+# need the current branch; chained in one process, only the first pays
+# the git spawn. Same pattern as the listing memos in files.py.
+_branch_memo: dict[str, str] = {}
+
+
+def _current_branch(cwd: Path) -> str:
+    """Current branch name, memoized for the process lifetime."""
+    key = str(cwd)
+    if key not in _branch_memo:
+        _branch_memo[key] = _run_git(["branch", "--show-current"], cwd=cwd).strip()
+    return _branch_memo[key]
+
+
+def _iter_git_lines(args: list[str], cwd: Path) -> Iterator[str]:
+    """Stream git stdout line by line (for large log outputs)."""
+    tools = discover_tools()
+    if not tools.git:
+        raise typer.Exit(1)
+
+    yield from iter_tool_lines(tools.git, args, cwd=cwd)
+
+
+def _run_git_head(args: list[str], cwd: Path, n: int) -> list[str]:
+    """Run git and return at most the first n stdout lines.
+
+    Bounded read for display heads: lines past the cap are never
+    materialized as Python strings (unlike split("\n")[:n] over the
+    full output) and git is stopped once the head is in hand.
+    """
+    tools = discover_tools()
+    if not tools.git:
+        raise typer.Exit(1)
+
+    proc = subprocess.Popen(
+        [str(tools.git)] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert proc.stdout is not None
+    try:
+        lines = [line.rstrip("\n") for line in islice(proc.stdout, n)]
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+    return lines
+
+
+def _iter_git_paths(args: list[str], cwd: Path) -> Iterator[bytes]:
+    """Stream NUL-delimited paths from a git -z command, as bytes.
+
+    NUL framing skips the per-line strip that newline parsing needs
+    (git emits blank separator lines between commits) and is robust for
+    paths containing spaces or newlines. Records stay as bytes so
+    callers can defer decoding to print time.
+    """
+    tools = discover_tools()
+    if not tools.git:
+        raise typer.Exit(1)
+
+    proc = subprocess.Popen(
+        [str(tools.git)] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    try:
+        buf = b""
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            records = (buf + chunk).split(b"\0")
+            buf = records.pop()
+            for record in records:
+                if record:
+                    yield record
+        if buf:
+            yield buf
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def _ensure_commit_graph(grove_root: Path) -> None:
+    """Kick off a commit-graph refresh if the cached one is stale.
+
+    Changed-path Bloom filters let `git log -- <path>` skip commits that
+    cannot have touched the path — the dominant cost of history_cmd's
+    --follow walks on big repos. The write runs detached so the current
+    command never waits on it; later invocations get the benefit.
+    """
+    graph = grove_root / ".git" / "objects" / "info" / "commit-graph"
+    try:
+        if time.time() - graph.stat().st_mtime < 24 * 3600:
+            return
+    except OSError:
+        # No graph yet; only proceed for a regular .git directory
+        if not (grove_root / ".git").is_dir():
+            return
+
+    tools = discover_tools()
+    if not tools.git:
+        return
+    subprocess.Popen(
+        [str(tools.git), "commit-graph", "write", "--reachable", "--changed-paths"],
+        cwd=grove_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
 def recent_command(days: int = 7) -> None:
     """Find recently modified files."""
     config = get_config()
 
     print_section(f"Files modified in the last {days} day(s)", "")
 
-    # Use git log for tracked files
-    output = _run_git(
-        ["log", f"--since={days} days ago", "--name-only", "--pretty=format:"],
+    # Use git log for tracked files, streamed NUL-delimited: the dedupe
+    # set is built incrementally and paths stay as bytes until printed
+    files: set[bytes] = set()
+    # -n 500 bounds the walk: beyond that many commits the file set has
+    # long since saturated for any realistic window
+    for path in _iter_git_paths(
+        [
+            "log",
+            f"--since={days} days ago",
+            "-n",
+            "500",
+            "--name-only",
+            "-z",
+            "--pretty=format:",
+        ],
         cwd=config.grove_root,
-    )
+    ):
+        if not _EXCLUDE_RE_B.search(path):
+            files.add(path)
 
-    if output:
-        # Filter and dedupe
-        files = set()
-        for line in output.strip().split("\n"):
-            line = line.strip()
-            if line and not any(
-                exc in line
-                for exc in ["node_modules", "dist", ".svelte-kit", "pnpm-lock"]
-            ):
-                files.add(line)
-
-        sorted_files = sorted(files)[:50]
+    if files:
+        sorted_files = [f.decode() for f in sorted(files)[:50]]
         console.print_raw("\n".join(sorted_files))
 
         # Summary by directory
         print_section("Summary by directory", "")
-        dirs = {}
-        for f in files:
-            d = "/".join(f.split("/")[:-1]) if "/" in f else "."
-            dirs[d] = dirs.get(d, 0) + 1
+        dirs = Counter(f.rpartition(b"/")[0] or b"." for f in files)
 
-        for d, count in sorted(dirs.items(), key=lambda x: -x[1])[:15]:
-            console.print(f"  {count:4d}  {d}/")
+        for d, count in dirs.most_common(15):
+            console.print(f"  {count:4d}  {d.decode()}/")
     else:
         print_warning(f"No files modified in the last {days} days")
 
@@ -75,28 +206,34 @@ def changed_command(base: str = "main") -> None:
     """Find files changed on current branch vs base."""
     config = get_config()
 
-    # Get current branch
-    current = _run_git(["branch", "--show-current"], cwd=config.grove_root).strip()
+    # The four queries are independent; run them concurrently instead of
+    # paying for four sequential git spawns
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        branch_future = pool.submit(_current_branch, config.grove_root)
+        diff_future = pool.submit(
+            _run_git, ["diff", "--name-only", f"{base}...HEAD"], cwd=config.grove_root
+        )
+        stat_future = pool.submit(
+            _run_git, ["diff", "--stat", f"{base}...HEAD"], cwd=config.grove_root
+        )
+        log_future = pool.submit(
+            _run_git, ["log", "--oneline", f"{base}..HEAD"], cwd=config.grove_root
+        )
+        current = branch_future.result()
+        output = diff_future.result()
+        stat = stat_future.result()
+        commits = log_future.result()
 
     print_section(f"Files changed on {current} vs {base}", "")
 
-    # Get changed files
-    output = _run_git(
-        ["diff", "--name-only", f"{base}...HEAD"],
-        cwd=config.grove_root,
-    )
-
     if output:
         files = [
-            f
-            for f in output.strip().split("\n")
-            if f and "pnpm-lock" not in f and "node_modules" not in f
+            f for f in output.strip().split("\n") if f and not _LOCKFILE_RE.search(f)
         ]
         console.print_raw("\n".join(files[:50]))
 
         # Change summary
         print_section("Change Summary", "")
-        stat = _run_git(["diff", "--stat", f"{base}...HEAD"], cwd=config.grove_root)
         if stat:
             # Just the summary line
             lines = stat.strip().split("\n")
@@ -105,16 +242,12 @@ def changed_command(base: str = "main") -> None:
 
         # By file type
         print_section("By Type", "")
-        types = {}
-        for f in files:
-            ext = f.split(".")[-1] if "." in f else "other"
-            types[ext] = types.get(ext, 0) + 1
-        for ext, count in sorted(types.items(), key=lambda x: -x[1]):
+        types = Counter(f.split(".")[-1] if "." in f else "other" for f in files)
+        for ext, count in types.most_common():
             console.print(f"  {count:4d}  .{ext}")
 
         # Commits on branch
         print_section("Commits on this branch", "")
-        commits = _run_git(["log", "--oneline", f"{base}..HEAD"], cwd=config.grove_root)
         if commits:
             lines = commits.strip().split("\n")[:15]
             console.print_raw("\n".join(lines))
@@ -166,45 +299,65 @@ def blame_cmd(
 def history_cmd(
     file: str = typer.Argument(..., help="File to show history for"),
     count: int = typer.Option(20, "-n", "--count", help="Number of commits to show"),
+    follow: bool = typer.Option(
+        False,
+        "--follow/--no-follow",
+        help="Track the file across renames (slower: forces rename detection)",
+    ),
 ) -> None:
     """Commit history for a specific file."""
     config = get_config()
 
+    # Refresh the commit-graph (with Bloom filters) in the background so
+    # the path-limited log walks below stay fast on large histories
+    _ensure_commit_graph(config.grove_root)
+
     print_section(f"History for: {file}", "")
 
+    # One walk yields everything the three sections need. --follow forces
+    # per-commit rename detection across the whole tree, so it is opt-in;
+    # without it, rename detection is switched off entirely and the
+    # commit-graph Bloom filters prune commits that never touched the path
+    if follow:
+        args = ["log", "--follow", "--format=%h%x1f%s%x1f%an", "--", file]
+    else:
+        args = [
+            "-c",
+            "diff.renames=false",
+            "-c",
+            "log.useCommitGraph=true",
+            "log",
+            "--format=%h%x1f%s%x1f%an",
+            "--",
+            file,
+        ]
+
+    commits: list[str] = []
+    author_counts: Counter[str] = Counter()
+    for record in _iter_git_lines(args, cwd=config.grove_root):
+        try:
+            short, subject, author = record.split("\x1f", 2)
+        except ValueError:
+            continue
+        commits.append(f"{short} {subject}")
+        author_counts[author] += 1
+
     # Commits
     print_section("Commits", "")
-    output = _run_git(
-        ["log", "--oneline", "-n", str(count), "--follow", "--", file],
-        cwd=config.grove_root,
-    )
-    if output:
-        console.print_raw(output.rstrip())
+    if commits:
+        console.print_raw("\n".join(commits[:count]))
     else:
         print_warning(f"No history found for {file}")
         return
 
     # Total commits
     print_section("Change frequency", "")
-    total = _run_git(
-        ["log", "--oneline", "--follow", "--", file],
-        cwd=config.grove_root,
-    )
-    total_count = len(total.strip().split("\n")) if total.strip() else 0
-    console.print(f"  Total commits touching this file: {total_count}")
+    console.print(f"  Total commits touching this file: {len(commits)}")
 
     # Contributors
     print_section("Contributors", "")
-    authors = _run_git(
-        ["log", "--format=%an", "--follow", "--", file],
-        cwd=config.grove_root,
-    )
-    if authors:
-        author_counts = {}
-        for author in authors.strip().split("\n"):
-            author_counts[author] = author_counts.get(author, 0) + 1
-        for author, count in sorted(author_counts.items(), key=lambda x: -x[1])[:10]:
-            console.print(f"  {count:4d}  {author}")
+    for author, author_total in author_counts.most_common(10):
+        console.print(f"  {author_total:4d}  {author}")
 
 
 @app.command("pickaxe")
@@ -220,13 +373,15 @@ def pickaxe_cmd(
 
     print_section(f"Finding commits that added/removed: {search}", "")
 
-    args = ["log", "-S", search, "--oneline", "--all"]
+    # Only 30 hits are shown, so have git stop there rather than
+    # pickaxe-diffing the whole history and slicing here
+    args = ["log", "-S", search, "--oneline", "-n", "30", "--all"]
     if path:
         args.extend(["--", path])
 
     output = _run_git(args, cwd=config.grove_root)
     if output:
-        lines = output.strip().split("\n")[:30]
+        lines = output.strip().split("\n")
         console.print_raw("\n".join(lines))
         console.print("\nTip: Use 'git show <hash>' to see the full commit")
     else:
@@ -242,18 +397,19 @@ def commits_cmd(
 
     print_section(f"Recent {count} commits", "")
 
-    output = _run_git(
-        ["log", "--oneline", "--stat", "-n", str(count)],
-        cwd=config.grove_root,
-    )
-    if output:
-        # Filter out noisy files
-        lines = [
-            line
-            for line in output.split("\n")
-            if "node_modules" not in line and "pnpm-lock" not in line
-        ]
-        console.print_raw("\n".join(lines[:100]))
+    # Stream the log and stop at the display cap; only surviving lines
+    # are ever materialized
+    lines: list[str] = []
+    for line in _iter_git_lines(
+        ["log", "--oneline", "--stat", "-n", str(count)], cwd=config.grove_root
+    ):
+        if _LOCKFILE_RE.search(line):
+            continue
+        lines.append(line)
+        if len(lines) >= 100:
+            break
+    if lines:
+        console.print_raw("\n".join(lines))
 
     # Today's commits
     print_section("Today's commits", "")
@@ -263,10 +419,13 @@ def commits_cmd(
     else:
         console.print("  (none)")
 
-    # This week count
+    # This week count — rev-list --count has git produce the integer
+    # directly instead of printing every commit line just to len() them
     print_section("This week", "")
-    week = _run_git(["log", "--oneline", "--since=1 week ago"], cwd=config.grove_root)
-    week_count = len(week.strip().split("\n")) if week.strip() else 0
+    week = _run_git(
+        ["rev-list", "--count", "--since=1 week ago", "HEAD"], cwd=config.grove_root
+    )
+    week_count = int(week.strip() or 0)
     console.print(f"  {week_count} commits in the last 7 days")
 
 
@@ -279,38 +438,32 @@ def churn_cmd(
 
     print_section(f"Code Churn: Most frequently changed files (last {days} days)", "")
 
-    output = _run_git(
-        ["log", f"--since={days} days ago", "--name-only", "--pretty=format:"],
-        cwd=config.grove_root,
+    # Streamed NUL-delimited: counts accumulate per path so the full log
+    # output is never buffered, and paths stay as bytes until printed
+    file_counts: Counter[bytes] = Counter()
+    file_counts.update(
+        path
+        for path in _iter_git_paths(
+            ["log", f"--since={days} days ago", "--name-only", "-z", "--pretty=format:"],
+            cwd=config.grove_root,
+        )
+        if not _EXCLUDE_RE_B.search(path)
     )
 
-    if output:
-        # Count occurrences
-        file_counts = {}
-        for line in output.strip().split("\n"):
-            line = line.strip()
-            if line and not any(
-                exc in line
-                for exc in ["node_modules", "pnpm-lock", "dist", ".svelte-kit"]
-            ):
-                file_counts[line] = file_counts.get(line, 0) + 1
-
+    if file_counts:
         # Top 20
         print_section("Top 20 Hotspots", "")
-        sorted_files = sorted(file_counts.items(), key=lambda x: -x[1])[:20]
-        for file, count in sorted_files:
-            console.print(f"  {count:4d} changes: {file}")
+        for file, count in file_counts.most_common(20):
+            console.print(f"  {count:4d} changes: {file.decode()}")
 
         # By directory
         print_section("By Directory", "")
-        dir_counts = {}
+        dir_counts: Counter[bytes] = Counter()
         for file, count in file_counts.items():
-            d = "/".join(file.split("/")[:-1]) if "/" in file else "."
-            dir_counts[d] = dir_counts.get(d, 0) + count
+            dir_counts[file.rpartition(b"/")[0] or b"."] += count
 
-        sorted_dirs = sorted(dir_counts.items(), key=lambda x: -x[1])[:10]
-        for d, count in sorted_dirs:
-            console.print(f"  {count:4d} changes: {d}/")
+        for d, count in dir_counts.most_common(10):
+            console.print(f"  {count:4d} changes: {d.decode()}/")
 
         console.print("\nTip: High churn files often have bugs or need refactoring")
     else:
@@ -322,40 +475,58 @@ def branches_cmd() -> None:
     """List branches with useful info."""
     config = get_config()
 
-    print_section("Git Branches", "")
+    # Ref listings are pure functions of repo state, so serve repeats
+    # from the disk cache (keyed by HEAD + index mtime, short TTL); on
+    # cold runs the four queries are issued concurrently
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        current_future = pool.submit(_current_branch, config.grove_root)
+        local_future = pool.submit(
+            cached_run_git,
+            [
+                "for-each-ref",
+                "--sort=-committerdate",
+                "refs/heads/",
+                "--format=%(refname:short)|%(committerdate:relative)|%(subject)",
+            ],
+            cwd=config.grove_root,
+        )
+        remotes_future = pool.submit(
+            cached_run_git, ["branch", "-r"], cwd=config.grove_root
+        )
+        merged_future = pool.submit(
+            cached_run_git, ["branch", "--merged", "main"], cwd=config.grove_root
+        )
+        current = current_future.result()
+        output = local_future.result()
+        remotes = remotes_future.result()
+        merged = merged_future.result()
 
-    current = _run_git(["branch", "--show-current"], cwd=config.grove_root).strip()
+    print_section("Git Branches", "")
     console.print(f"Current: {current}")
 
     print_section("Local Branches (by last commit)", "")
-    output = _run_git(
-        [
-            "for-each-ref",
-            "--sort=-committerdate",
-            "refs/heads/",
-            "--format=%(refname:short)|%(committerdate:relative)|%(subject)",
-        ],
-        cwd=config.grove_root,
-    )
     if output:
+        # Build the listing once and emit a single write instead of
+        # paying Rich's per-call overhead for every row
+        out: list[str] = []
         for line in output.strip().split("\n")[:15]:
             parts = line.split("|")
             if len(parts) >= 3:
                 branch, date, subject = parts[0], parts[1], parts[2]
                 if branch == current:
-                    console.print(f"  * {branch} ({date})")
+                    out.append(f"  * {branch} ({date})")
                 else:
-                    console.print(f"    {branch} ({date})")
-                console.print(f"      {subject[:60]}")
+                    out.append(f"    {branch} ({date})")
+                out.append(f"      {subject[:60]}")
+        if out:
+            console.print_raw("\n".join(out))
 
     print_section("Remote Branches", "")
-    remotes = _run_git(["branch", "-r"], cwd=config.grove_root)
     if remotes:
         lines = remotes.strip().split("\n")[:10]
         console.print_raw("\n".join(lines))
 
     print_section("Merged to main (safe to delete)", "")
-    merged = _run_git(["branch", "--merged", "main"], cwd=config.grove_root)
     if merged:
         branches = [
             b.strip()
@@ -377,7 +548,24 @@ def pr_cmd(
     """PR preparation summary."""
     config = get_config()
 
-    current = _run_git(["branch", "--show-current"], cwd=config.grove_root).strip()
+    # Four independent queries run concurrently; the commit subjects and
+    # the name-only file list are derived from them rather than asking
+    # git again for the same data
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        branch_future = pool.submit(_current_branch, config.grove_root)
+        commits_future = pool.submit(
+            _run_git, ["log", "--oneline", f"{base}..HEAD"], cwd=config.grove_root
+        )
+        status_future = pool.submit(
+            _run_git, ["diff", "--name-status", f"{base}...HEAD"], cwd=config.grove_root
+        )
+        stats_future = pool.submit(
+            _run_git, ["diff", "--stat", f"{base}...HEAD"], cwd=config.grove_root
+        )
+        current = branch_future.result()
+        commits = commits_future.result()
+        files = status_future.result()
+        stats = stats_future.result()
 
     print_header("PR Summary", "")
 
@@ -385,25 +573,22 @@ def pr_cmd(
 
     # Commits
     print_section("Commits to be merged", "")
-    commits = _run_git(["log", "--oneline", f"{base}..HEAD"], cwd=config.grove_root)
     if commits.strip():
         console.print_raw(commits.rstrip())
-        commit_count = len(commits.strip().split("\n"))
-        console.print(f"\nTotal: {commit_count} commits")
+        commit_lines = commits.strip().split("\n")
+        console.print(f"\nTotal: {len(commit_lines)} commits")
     else:
         console.print("  (no commits)")
         return
 
     # Files changed
     print_section("Files Changed", "")
-    files = _run_git(["diff", "--name-status", f"{base}...HEAD"], cwd=config.grove_root)
-    if files:
-        lines = [l for l in files.strip().split("\n") if "pnpm-lock" not in l][:30]
-        console.print_raw("\n".join(lines))
+    status_lines = [l for l in files.strip().split("\n") if l and "pnpm-lock" not in l]
+    if status_lines:
+        console.print_raw("\n".join(status_lines[:30]))
 
     # Stats
     print_section("Change Stats", "")
-    stats = _run_git(["diff", "--stat", f"{base}...HEAD"], cwd=config.grove_root)
     if stats:
         console.print(stats.strip().split("\n")[-1])
 
@@ -411,19 +596,19 @@ def pr_cmd(
     print_section("Suggested PR Description", "")
     console.print("(Copy this as a starting point)\n")
     console.print("## Summary")
-    commit_subjects = _run_git(
-        ["log", "--format=- %s", f"{base}..HEAD"], cwd=config.grove_root
-    )
-    if commit_subjects:
-        lines = commit_subjects.strip().split("\n")[:10]
-        console.print_raw("\n".join(lines))
+    subjects = [
+        "- " + (line.split(" ", 1)[1] if " " in line else line)
+        for line in commit_lines[:10]
+    ]
+    if subjects:
+        console.print_raw("\n".join(subjects))
 
     console.print("\n## Files Changed")
-    changed = _run_git(["diff", "--name-only", f"{base}...HEAD"], cwd=config.grove_root)
-    if changed:
-        for f in changed.strip().split("\n")[:15]:
-            if "pnpm-lock" not in f:
-                console.print(f"- {f}")
+    # name-status lines carry the path in the last tab field (rename
+    # lines carry the new name there)
+    for line in status_lines[:15]:
+        path = line.rsplit("\t", 1)[-1]
+        console.print(f"- {path}")
 
     console.print("\n## Test Plan")
     console.print("- [ ] Tested locally")
@@ -435,14 +620,38 @@ def wip_cmd() -> None:
     """Work in progress status."""
     config = get_config()
 
-    print_section("Work in Progress", "")
+    # The four status queries are independent; overlap their fork+exec
+    # and index reads instead of paying four sequential git spawns
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        branch_future = pool.submit(_current_branch, config.grove_root)
+        staged_future = pool.submit(
+            _run_git, ["diff", "--cached", "--name-status"], cwd=config.grove_root
+        )
+        unstaged_future = pool.submit(
+            _run_git, ["diff", "--name-status"], cwd=config.grove_root
+        )
+        # NUL-delimited and filtered in one pass; paths stay as bytes
+        # until printed
+        untracked_future = pool.submit(
+            lambda: [
+                path
+                for path in _iter_git_paths(
+                    ["ls-files", "--others", "--exclude-standard", "-z"],
+                    cwd=config.grove_root,
+                )
+                if not _EXCLUDE_RE_B.search(path)
+            ]
+        )
+        branch = branch_future.result()
+        staged = staged_future.result()
+        unstaged = unstaged_future.result()
+        untracked = untracked_future.result()
 
-    branch = _run_git(["branch", "--show-current"], cwd=config.grove_root).strip()
+    print_section("Work in Progress", "")
     console.print(f"Branch: {branch}")
 
     # Staged
     print_section("Staged Changes", "")
-    staged = _run_git(["diff", "--cached", "--name-status"], cwd=config.grove_root)
     if staged.strip():
         console.print_raw(staged.rstrip()[:500])
     else:
@@ -450,7 +659,6 @@ def wip_cmd() -> None:
 
     # Unstaged
     print_section("Unstaged Changes", "")
-    unstaged = _run_git(["diff", "--name-status"], cwd=config.grove_root)
     if unstaged.strip():
         console.print_raw(unstaged.rstrip()[:500])
     else:
@@ -458,19 +666,8 @@ def wip_cmd() -> None:
 
     # Untracked
     print_section("Untracked Files", "")
-    untracked = _run_git(
-        ["ls-files", "--others", "--exclude-standard"], cwd=config.grove_root
-    )
-    if untracked.strip():
-        files = [
-            f
-            for f in untracked.strip().split("\n")
-            if not any(exc in f for exc in ["node_modules", "dist", ".svelte-kit"])
-        ]
-        if files:
-            console.print_raw("\n".join(files[:15]))
-        else:
-            console.print("  (no untracked files)")
+    if untracked:
+        console.print_raw("\n".join(f.decode() for f in untracked[:15]))
     else:
         console.print("  (no untracked files)")
 
@@ -478,12 +675,7 @@ def wip_cmd() -> None:
     print_section("Summary", "")
     staged_count = len(staged.strip().split("\n")) if staged.strip() else 0
     unstaged_count = len(unstaged.strip().split("\n")) if unstaged.strip() else 0
-    untracked_filtered = [
-        f
-        for f in (untracked.strip().split("\n") if untracked.strip() else [])
-        if not any(exc in f for exc in ["node_modules", "dist"])
-    ]
-    untracked_count = len(untracked_filtered) if untracked_filtered[0] else 0
+    untracked_count = len(untracked)
 
     console.print(f"  Staged:    {staged_count}")
     console.print(f"  Unstaged:  {unstaged_count}")
@@ -511,11 +703,10 @@ def stash_cmd(
     if index is not None:
         # Show specific stash
         print_section(f"Stash {index} details", "")
-        output = _run_git(
-            ["stash", "show", "-p", f"stash@{{{index}}}"], cwd=config.grove_root
+        lines = _run_git_head(
+            ["stash", "show", "-p", f"stash@{{{index}}}"], cwd=config.grove_root, n=50
         )
-        if output:
-            lines = output.strip().split("\n")[:50]
+        if lines:
             console.print_raw("\n".join(lines))
     else:
         # List all stashes
@@ -524,13 +715,28 @@ def stash_cmd(
 
         print_section("Stash Contents Preview", "")
         stashes = stash_list.strip().split("\n")
-        for i, _ in enumerate(stashes[:5]):
-            console.print(f"\nstash@{{{i}}}:")
-            show = _run_git(["stash", "show", f"stash@{{{i}}}"], cwd=config.grove_root)
-            if show:
-                lines = show.strip().split("\n")[:5]
-                for line in lines:
-                    console.print(f"  {line}")
+        shown = min(len(stashes), 5)
+
+        # The per-stash shows are independent; overlap the spawns and
+        # gather in order instead of running up to five git calls back
+        # to back
+        with ThreadPoolExecutor(max_workers=shown) as pool:
+            shows = list(
+                pool.map(
+                    lambda i: _run_git_head(
+                        ["stash", "show", f"stash@{{{i}}}"],
+                        cwd=config.grove_root,
+                        n=5,
+                    ),
+                    range(shown),
+                )
+            )
+
+        preview: list[str] = []
+        for i, show in enumerate(shows):
+            preview.append(f"\nstash@{{{i}}}:")
+            preview.extend(f"  {line}" for line in show)
+        console.print_raw("\n".join(preview))
 
         console.print("\nUse 'gf git stash <n>' to see full diff of stash n")
         console.print("Use 'git stash pop' to apply and remove latest stash")
@@ -588,9 +794,7 @@ def tag_cmd(
     )
     if files:
         filtered = [
-            f
-            for f in files.strip().split("\n")
-            if "pnpm-lock" not in f and "node_modules" not in f
+            f for f in files.strip().split("\n") if not _LOCKFILE_RE.search(f)
         ]
         console.print_raw("\n".join(filtered[:50]))
 
@@ -4,13 +4,21 @@ Provides: gf github issue, gf github issues, gf github board, gf github mine, et
 Gracefully handles missing gh CLI.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nlargest
+from itertools import islice
 from pathlib import Path
 from typing import Optional
+import io
 import json as json_lib
+import os
+import re
 import typer
 
+from grove_find.core import gh_cache
 from grove_find.core.config import get_config
-from grove_find.core.tools import discover_tools, run_tool
+from grove_find.core.tools import discover_tools, run_tool, run_tool_bytes
 from grove_find.output import (
     console,
     print_header,
@@ -21,6 +29,43 @@ from grove_find.output import (
 
 app = typer.Typer(help="GitHub issue commands")
 
+# Listing caps. Env overrides (GROVE_GH_LIMIT_LIST / _BOARD / _STALE /
+# _REFS) let batch workflows widen the view without editing code; 0
+# means "everything" (--paginate where the endpoint supports it,
+# otherwise gh issue list's maximum of 1000).
+LIMIT_LIST = 30
+LIMIT_BOARD = 100
+LIMIT_STALE = 100
+LIMIT_REFS = 10
+
+
+def _env_limit(env_name: str, default: int) -> Optional[int]:
+    """Listing cap from an env override; 0 or negative means unlimited."""
+    try:
+        value = int(os.environ.get(env_name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else None
+
+
+def _limit_args(env_name: str, default: int) -> list[str]:
+    """--limit arguments for gh issue/pr list, honoring the env override."""
+    limit = _env_limit(env_name, default)
+    return ["--limit", str(limit if limit is not None else 1000)]
+
+
+# Issue references in commit subjects; \b keeps #123abc (URLs, hashes)
+# from matching
+_ISSUE_REF_RE = re.compile(r"#(\d+)\b")
+
+# Optional fast path: orjson's Rust parser is ~5x faster on the
+# 100-issue payloads board/stale fetch. Both parsers raise a
+# ValueError subclass, so call sites catch ValueError.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json_lib.loads
+
 
 def _check_gh() -> bool:
     """Check if gh CLI is available."""
@@ -41,6 +86,34 @@ def _run_gh(args: list[str], cwd: Path) -> tuple[str, bool]:
         return "", False
 
 
+def _run_gh_cached(
+    args: list[str], cwd: Path, ttl: float = 60.0
+) -> tuple[bytes, bool]:
+    """_run_gh with a short-TTL disk cache for read-only endpoints.
+
+    Returns bytes: these call sites feed JSON parsers (which take bytes
+    directly), so the text-mode decode would be pure overhead.
+    """
+    key = "|".join([str(cwd), *args])
+    hit = gh_cache.get(key, ttl)
+    if hit is not None:
+        return hit, True
+
+    tools = discover_tools()
+    if not tools.gh:
+        return b"", False
+
+    try:
+        result = run_tool_bytes(tools.gh, args, cwd=cwd)
+        output, success = result.stdout, result.returncode == 0
+    except Exception:
+        return b"", False
+
+    if success and output:
+        gh_cache.put(key, output)
+    return output, success
+
+
 def _run_git(args: list[str], cwd: Path) -> str:
     """Run git command."""
     tools = discover_tools()
@@ -50,36 +123,189 @@ def _run_git(args: list[str], cwd: Path) -> str:
     return result.stdout
 
 
-def _run_rg(args: list[str], cwd: Path) -> str:
-    """Run ripgrep command."""
+# Built once per process: the output mode cannot change mid-run, so
+# there is no reason to re-read config and rebuild the argument list
+# on every search. Same memo pattern as the fd args cache in files.py.
+_rg_args_memo: Optional[list[str]] = None
+
+
+def _rg_base_args() -> list[str]:
+    """Base ripgrep arguments (flags, color mode, excludes), memoized."""
+    global _rg_args_memo
+    if _rg_args_memo is None:
+        config = get_config()
+        color = "--color=always" if config.is_human_mode else "--color=never"
+        _rg_args_memo = [
+            "--line-number",
+            "--no-heading",
+            "--no-messages",
+            color,
+            "--glob",
+            "!node_modules",
+            "--glob",
+            "!.git",
+            "--glob",
+            "!dist",
+            "--glob",
+            "!pnpm-lock.yaml",
+            "--glob",
+            "!*.lock",
+        ]
+    return _rg_args_memo
+
+
+def _run_rg(args: list[str], cwd: Path, max_count: Optional[int] = None) -> str:
+    """Run ripgrep command.
+
+    max_count caps matches per file via rg --max-count, bounding output
+    at the producer for display-limited callers.
+    """
     tools = discover_tools()
     if not tools.rg:
         return ""
 
-    config = get_config()
-    base_args = ["--line-number", "--no-heading"]
-    if config.is_human_mode:
-        base_args.append("--color=always")
-    else:
-        base_args.append("--color=never")
-
-    excludes = [
-        "--glob",
-        "!node_modules",
-        "--glob",
-        "!.git",
-        "--glob",
-        "!dist",
-        "--glob",
-        "!pnpm-lock.yaml",
-        "--glob",
-        "!*.lock",
-    ]
+    full_args = list(_rg_base_args())
+    if max_count is not None:
+        full_args.extend(["--max-count", str(max_count)])
 
-    result = run_tool(tools.rg, base_args + excludes + args, cwd=cwd)
+    result = run_tool(tools.rg, full_args + args, cwd=cwd)
     return result.stdout
 
 
+_ISSUE_DETAIL_QUERY = """\
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      number title state body
+      labels(first: 10) { nodes { name } }
+      assignees(first: 10) { nodes { login } }
+      timelineItems(first: 20, itemTypes: CROSS_REFERENCED_EVENT) {
+        nodes {
+          ... on CrossReferencedEvent {
+            source { ... on PullRequest { number title state } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _fetch_issue_detail(number: int, cwd: Path) -> Optional[tuple[dict, list[str]]]:
+    """Fetch an issue and its cross-referenced PRs in one API trip.
+
+    One GraphQL round-trip replaces the separate issue view and pr list
+    spawns; the server joins the data. Returns (issue, pr_lines) or
+    None, in which case the caller falls back to the two-call path.
+    """
+    repo, success = _run_gh(
+        ["repo", "view", "--json", "nameWithOwner", "--jq", ".nameWithOwner"],
+        cwd=cwd,
+    )
+    if not success or "/" not in repo:
+        return None
+    owner, name = repo.strip().split("/", 1)
+
+    output, _ = _run_gh(
+        [
+            "api",
+            "graphql",
+            "-F",
+            f"owner={owner}",
+            "-F",
+            f"name={name}",
+            "-F",
+            f"number={number}",
+            "-f",
+            f"query={_ISSUE_DETAIL_QUERY}",
+        ],
+        cwd=cwd,
+    )
+    if not output.strip():
+        return None
+    try:
+        data = _loads(output)
+    except ValueError:
+        return None
+
+    issue = ((data.get("data") or {}).get("repository") or {}).get("issue")
+    if not issue:
+        return None
+
+    pr_lines = []
+    for node in (issue.get("timelineItems") or {}).get("nodes") or []:
+        source = (node or {}).get("source") or {}
+        if source.get("number"):
+            pr_lines.append(
+                f"#{source['number']} [{source['state']}] {source['title']}"
+            )
+    return issue, pr_lines
+
+
+def _cached_gh_user(cwd: Path, refresh: bool = False) -> Optional[str]:
+    """GitHub username: env override, then 24h disk cache, then the API.
+
+    The login changes approximately never, so mine should not pay an
+    HTTPS round-trip for it on every run.
+    """
+    if not refresh:
+        for var in ("GH_USER", "GITHUB_USER"):
+            user = os.environ.get(var)
+            if user:
+                return user
+
+    output, success = _run_gh_cached(
+        ["api", "user", "--jq", ".login"],
+        cwd=cwd,
+        ttl=0.0 if refresh else 86400.0,
+    )
+    user = output.decode(errors="replace").strip()
+    return user if success and user else None
+
+
+def _fetch_issue_summaries(nums: list[str], cwd: Path) -> list[str]:
+    """Resolve issue numbers to "#N [STATE] title" lines in one API trip.
+
+    A single GraphQL query with one alias per number replaces the
+    per-issue `gh issue view` spawn (fork/exec plus an HTTPS round-trip
+    each). issueOrPullRequest keeps numbers that turned out to be PRs
+    from failing the whole query.
+    """
+    repo, success = _run_gh(
+        ["repo", "view", "--json", "nameWithOwner", "--jq", ".nameWithOwner"],
+        cwd=cwd,
+    )
+    if not success or "/" not in repo:
+        return []
+    owner, name = repo.strip().split("/", 1)
+
+    fragment = (
+        "{ ... on Issue { number state title }"
+        " ... on PullRequest { number state title } }"
+    )
+    fields = " ".join(
+        f"i{num}: issueOrPullRequest(number: {num}) {fragment}" for num in nums
+    )
+    query = f'query {{ repository(owner: "{owner}", name: "{name}") {{ {fields} }} }}'
+
+    output, _ = _run_gh(["api", "graphql", "-f", f"query={query}"], cwd=cwd)
+    if not output.strip():
+        return []
+    try:
+        data = _loads(output)
+    except ValueError:
+        return []
+
+    nodes = (data.get("data") or {}).get("repository") or {}
+    lines = []
+    for num in nums:
+        node = nodes.get(f"i{num}")
+        if node:
+            lines.append(f"#{node['number']} [{node['state']}] {node['title']}")
+    return lines
+
+
 @app.command("issue")
 def issue_cmd(
     number: Optional[int] = typer.Argument(None, help="Issue number to view"),
@@ -96,53 +322,119 @@ def issue_cmd(
         print_header("Open Issues", "")
 
         output, success = _run_gh(
-            ["issue", "list", "--state", "open", "--limit", "20"], cwd=config.grove_root
+            ["issue", "list", "--state", "open"]
+            + _limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
+            cwd=config.grove_root,
         )
         if success and output:
             console.print_raw(output.rstrip())
         else:
             console.print("  (unable to fetch issues)")
 
-        # Count
+        # Count — gh's embedded jq reduces the listing to one integer,
+        # so only that crosses the pipe instead of every issue number
         output, _ = _run_gh(
-            ["issue", "list", "--state", "open", "--json", "number"],
+            [
+                "issue",
+                "list",
+                "--state",
+                "open",
+                "--limit",
+                "1000",
+                "--json",
+                "number",
+                "--jq",
+                "length",
+            ],
             cwd=config.grove_root,
         )
-        if output:
-            try:
-                count = len(json_lib.loads(output))
-                console.print(f"\nTotal open: {count}")
-            except json_lib.JSONDecodeError:
-                pass
+        count = output.strip()
+        if count.isdigit():
+            console.print(f"\nTotal open: {count}")
 
         console.print("Use 'gf github issue <number>' for details")
     else:
         # Show specific issue
         print_header(f"Issue #{number}", "")
 
-        output, success = _run_gh(["issue", "view", str(number)], cwd=config.grove_root)
-        if success and output:
-            console.print_raw(output.rstrip())
+        # One GraphQL trip serves the issue and its cross-referenced PRs
+        # together; the two local git queries overlap with it
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            detail_future = pool.submit(
+                _fetch_issue_detail, number, config.grove_root
+            )
+            branches_future = pool.submit(
+                _run_git, ["branch", "-a"], cwd=config.grove_root
+            )
+            # -n lets git stop after the matches we display instead of
+            # grepping every commit on every ref
+            commits_future = pool.submit(
+                _run_git,
+                ["log", "--oneline", "--all", "-n", "10", f"--grep=#{number}"],
+                cwd=config.grove_root,
+            )
+            detail = detail_future.result()
+            branches = branches_future.result()
+            commits = commits_future.result()
+
+        if detail is not None:
+            issue, pr_lines = detail
+            header = [f"{issue['title']} (#{issue['number']}) [{issue['state']}]"]
+            labels = ", ".join(n["name"] for n in issue["labels"]["nodes"])
+            if labels:
+                header.append(f"Labels: {labels}")
+            assignees = ", ".join(n["login"] for n in issue["assignees"]["nodes"])
+            if assignees:
+                header.append(f"Assignees: {assignees}")
+            body = (issue.get("body") or "").strip()
+            if body:
+                header.append("\n" + body)
+            console.print_raw("\n".join(header))
         else:
-            print_error(f"Issue #{number} not found")
-            return
+            # GraphQL unavailable (auth, fork without API access, …):
+            # fall back to the plain view, which also decides whether
+            # the issue exists at all
+            output, success = _run_gh(
+                ["issue", "view", str(number)], cwd=config.grove_root
+            )
+            if success and output:
+                console.print_raw(output.rstrip())
+            else:
+                print_error(f"Issue #{number} not found")
+                return
 
         # Related PRs
         print_section("Related PRs", "")
-        output, success = _run_gh(
-            ["pr", "list", "--state", "all", "--search", f"#{number}", "--limit", "10"],
-            cwd=config.grove_root,
-        )
-        if success and output.strip():
-            console.print_raw(output.rstrip())
+        if detail is not None:
+            if detail[1]:
+                console.print_raw("\n".join(detail[1]))
+            else:
+                console.print("  No PRs reference this issue")
         else:
-            console.print("  No PRs reference this issue")
+            prs, prs_ok = _run_gh(
+                [
+                    "pr",
+                    "list",
+                    "--state",
+                    "all",
+                    "--search",
+                    f"#{number}",
+                    *_limit_args("GROVE_GH_LIMIT_REFS", LIMIT_REFS),
+                ],
+                cwd=config.grove_root,
+            )
+            if prs_ok and prs.strip():
+                console.print_raw(prs.rstrip())
+            else:
+                console.print("  No PRs reference this issue")
 
         # Related branches
         print_section("Related Branches", "")
-        branches = _run_git(["branch", "-a"], cwd=config.grove_root)
         if branches:
-            related = [b.strip() for b in branches.split("\n") if str(number) in b]
+            # Digit-boundary match: plain substring would let #1 match
+            # every branch containing a 1
+            num_re = re.compile(rf"(?<!\d){number}(?!\d)")
+            related = [b.strip() for b in branches.splitlines() if num_re.search(b)]
             if related:
                 console.print_raw("\n".join(related))
             else:
@@ -150,12 +442,8 @@ def issue_cmd(
 
         # Commits mentioning issue
         print_section(f"Commits Mentioning #{number}", "")
-        commits = _run_git(
-            ["log", "--oneline", "--all", f"--grep=#{number}"], cwd=config.grove_root
-        )
         if commits.strip():
-            lines = commits.strip().split("\n")[:10]
-            console.print_raw("\n".join(lines))
+            console.print_raw(commits.rstrip())
         else:
             console.print(f"  No commits mention #{number}")
 
@@ -178,18 +466,23 @@ def issues_cmd(
     if not filter_arg:
         console.print("Filter: open (default)\n")
         output, _ = _run_gh(
-            ["issue", "list", "--state", "open", "--limit", "30"], cwd=config.grove_root
+            ["issue", "list", "--state", "open"]
+            + _limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
+            cwd=config.grove_root,
         )
     elif filter_arg == "closed":
         console.print("Filter: closed\n")
         output, _ = _run_gh(
-            ["issue", "list", "--state", "closed", "--limit", "30"],
+            ["issue", "list", "--state", "closed"]
+            + _limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
             cwd=config.grove_root,
         )
     elif filter_arg == "all":
         console.print("Filter: all states\n")
         output, _ = _run_gh(
-            ["issue", "list", "--state", "all", "--limit", "30"], cwd=config.grove_root
+            ["issue", "list", "--state", "all"]
+            + _limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
+            cwd=config.grove_root,
         )
     elif filter_arg.startswith("@"):
         assignee = filter_arg[1:]
@@ -202,8 +495,7 @@ def issues_cmd(
                 "open",
                 "--assignee",
                 assignee,
-                "--limit",
-                "30",
+                *_limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
             ],
             cwd=config.grove_root,
         )
@@ -218,8 +510,7 @@ def issues_cmd(
                 "open",
                 "--label",
                 filter_arg,
-                "--limit",
-                "30",
+                *_limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
             ],
             cwd=config.grove_root,
         )
@@ -235,8 +526,7 @@ def issues_cmd(
                     "open",
                     "--search",
                     filter_arg,
-                    "--limit",
-                    "30",
+                    *_limit_args("GROVE_GH_LIMIT_LIST", LIMIT_LIST),
                 ],
                 cwd=config.grove_root,
             )
@@ -248,7 +538,11 @@ def issues_cmd(
 
 
 @app.command("board")
-def board_cmd() -> None:
+def board_cmd(
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the response cache"
+    ),
+) -> None:
     """Board-style overview of open issues grouped by label."""
     config = get_config()
 
@@ -259,32 +553,32 @@ def board_cmd() -> None:
     print_header("Issue Board", "")
 
     # Get all open issues with labels
-    output, success = _run_gh(
+    output, success = _run_gh_cached(
         [
             "issue",
             "list",
             "--state",
             "open",
-            "--limit",
-            "100",
+            *_limit_args("GROVE_GH_LIMIT_BOARD", LIMIT_BOARD),
             "--json",
             "number,title,labels,assignees,updatedAt",
         ],
         cwd=config.grove_root,
+        ttl=0.0 if no_cache else 60.0,
     )
 
-    if not success or not output.strip() or output.strip() == "[]":
+    if not success or not output.strip() or output.strip() == b"[]":
         console.print("No open issues found")
         return
 
     try:
-        issues = json_lib.loads(output)
-    except json_lib.JSONDecodeError:
+        issues = _loads(output)
+    except ValueError:
         console.print("Could not parse issues")
         return
 
     # Group by labels
-    label_issues = {}
+    label_issues: dict[str, list] = defaultdict(list)
     unlabeled = []
 
     for issue in issues:
@@ -293,10 +587,7 @@ def board_cmd() -> None:
             unlabeled.append(issue)
         else:
             for label in labels:
-                label_name = label.get("name", "unknown")
-                if label_name not in label_issues:
-                    label_issues[label_name] = []
-                label_issues[label_name].append(issue)
+                label_issues[label.get("name", "unknown")].append(issue)
 
     # Print by label
     for label_name in sorted(label_issues.keys()):
@@ -317,12 +608,18 @@ def board_cmd() -> None:
     print_section("Summary", "")
     console.print(f"  Total open: {len(issues)}")
     console.print("  By label:")
-    for label, items in sorted(label_issues.items(), key=lambda x: -len(x[1])):
+    for label, items in nlargest(
+        len(label_issues), label_issues.items(), key=lambda x: len(x[1])
+    ):
         console.print(f"    {len(items):4d}  {label}")
 
 
 @app.command("mine")
-def mine_cmd() -> None:
+def mine_cmd(
+    refresh_user: bool = typer.Option(
+        False, "--refresh-user", help="Re-fetch your username from the API"
+    ),
+) -> None:
     """Show issues assigned to you."""
     config = get_config()
 
@@ -332,47 +629,82 @@ def mine_cmd() -> None:
 
     print_header("My Issues", "")
 
-    # Get username
-    output, success = _run_gh(["api", "user", "--jq", ".login"], cwd=config.grove_root)
-    if not success or not output.strip():
+    username = _cached_gh_user(config.grove_root, refresh=refresh_user)
+    if not username:
         print_error(
             "Could not determine your GitHub username. Run 'gh auth login' first."
         )
         raise typer.Exit(1)
 
-    username = output.strip()
     console.print(f"Assigned to: @{username}\n")
 
+    # The three listings have no data dependencies once the username is
+    # known; fetch them concurrently and print in order
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        open_future = pool.submit(
+            _run_gh,
+            [
+                "issue",
+                "list",
+                "--state",
+                "open",
+                "--assignee",
+                username,
+                "--limit",
+                "30",
+            ],
+            cwd=config.grove_root,
+        )
+        closed_future = pool.submit(
+            _run_gh,
+            [
+                "issue",
+                "list",
+                "--state",
+                "closed",
+                "--assignee",
+                username,
+                "--limit",
+                "10",
+            ],
+            cwd=config.grove_root,
+        )
+        authored_future = pool.submit(
+            _run_gh,
+            [
+                "issue",
+                "list",
+                "--state",
+                "open",
+                "--author",
+                username,
+                "--limit",
+                "10",
+            ],
+            cwd=config.grove_root,
+        )
+        open_issues, _ = open_future.result()
+        closed_issues, _ = closed_future.result()
+        authored_issues, _ = authored_future.result()
+
     # Open issues assigned to me
     print_section("Open (assigned to me)", "")
-    output, _ = _run_gh(
-        ["issue", "list", "--state", "open", "--assignee", username, "--limit", "30"],
-        cwd=config.grove_root,
-    )
-    if output.strip():
-        console.print_raw(output.rstrip())
+    if open_issues.strip():
+        console.print_raw(open_issues.rstrip())
     else:
         console.print("  No open issues assigned to you")
 
     # Recently closed by me
     print_section("Recently Closed (by me)", "")
-    output, _ = _run_gh(
-        ["issue", "list", "--state", "closed", "--assignee", username, "--limit", "10"],
-        cwd=config.grove_root,
-    )
-    if output.strip():
-        console.print_raw(output.rstrip())
+    if closed_issues.strip():
+        console.print_raw(closed_issues.rstrip())
     else:
         console.print("  (none)")
 
     # Issues I created
     print_section("Created by Me (open)", "")
-    output, _ = _run_gh(
-        ["issue", "list", "--state", "open", "--author", username, "--limit", "10"],
-        cwd=config.grove_root,
-    )
-    if output.strip():
-        console.print_raw(output.rstrip())
+    if authored_issues.strip():
+        console.print_raw(authored_issues.rstrip())
     else:
         console.print("  (none)")
 
@@ -380,6 +712,9 @@ def mine_cmd() -> None:
 @app.command("stale")
 def stale_cmd(
     days: int = typer.Argument(30, help="Days of inactivity"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the response cache"
+    ),
 ) -> None:
     """Find issues with no recent activity."""
     config = get_config()
@@ -397,19 +732,34 @@ def stale_cmd(
 
     console.print(f"Issues with no activity since {cutoff}:\n")
 
-    # Get open issues with dates
-    output, success = _run_gh(
-        [
-            "issue",
-            "list",
-            "--state",
-            "open",
-            "--limit",
-            "100",
-            "--json",
-            "number,title,labels,updatedAt,assignees",
-        ],
+    # Ask the API for open issues sorted oldest-updated first: the
+    # server does the ordering, stale issues arrive as a prefix, and the
+    # oldest (most stale) issues can never be truncated away the way a
+    # newest-first --limit fetch could drop them
+    api_args = [
+        "api",
+        "-X",
+        "GET",
+        "repos/{owner}/{repo}/issues",
+        "-f",
+        "state=open",
+        "-f",
+        "sort=updated",
+        "-f",
+        "direction=asc",
+    ]
+    stale_limit = _env_limit("GROVE_GH_LIMIT_STALE", LIMIT_STALE)
+    if stale_limit is None:
+        # Unlimited: let gh walk every page; --slurp wraps the pages in
+        # one JSON array so the payload stays parseable
+        api_args.extend(["-f", "per_page=100", "--paginate", "--slurp"])
+    else:
+        api_args.extend(["-f", f"per_page={min(stale_limit, 100)}"])
+
+    output, success = _run_gh_cached(
+        api_args,
         cwd=config.grove_root,
+        ttl=0.0 if no_cache else 60.0,
     )
 
     if not success or not output.strip():
@@ -417,20 +767,28 @@ def stale_cmd(
         return
 
     try:
-        issues = json_lib.loads(output)
-    except json_lib.JSONDecodeError:
+        issues = _loads(output)
+    except ValueError:
         console.print("Could not parse issues")
         return
 
-    # Filter stale
+    # --slurp nests one list per page; flatten back to issues
+    if issues and isinstance(issues[0], list):
+        issues = [issue for page in issues for issue in page]
+
+    # Already oldest-first, so stale issues form a prefix: stop at the
+    # first fresh one. The REST issues endpoint also returns PRs, which
+    # gh issue list used to filter out for us.
     stale = []
     for issue in issues:
-        updated = issue.get("updatedAt", "")[:10]  # YYYY-MM-DD
-        if updated < cutoff:
-            stale.append((updated, issue))
+        if "pull_request" in issue:
+            continue
+        updated = issue.get("updated_at", "")[:10]  # YYYY-MM-DD
+        if updated >= cutoff:
+            break
+        stale.append((updated, issue))
 
     if stale:
-        stale.sort(key=lambda x: x[0])  # Oldest first
         console.print("#\tLast Updated\tTitle")
         for updated, issue in stale[:30]:
             console.print(f"#{issue['number']}\t{updated}\t{issue['title'][:50]}")
@@ -442,51 +800,80 @@ def stale_cmd(
 @app.command("refs")
 def refs_cmd(
     number: int = typer.Argument(..., help="Issue number to find references"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Limit commit search (e.g. '1 year ago')"
+    ),
 ) -> None:
     """Find where an issue is referenced across the project."""
     config = get_config()
 
     print_header(f"References to #{number}", "")
 
+    # One search each across code, commits, branches, and PRs — all
+    # independent, so run the spawns concurrently
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        code_future = pool.submit(
+            _run_rg,
+            [f"#{number}\\b", str(config.grove_root)],
+            cwd=config.grove_root,
+            max_count=2,
+        )
+        log_args = ["log", "--oneline", "--all", "-n", "15", f"--grep=#{number}"]
+        if since:
+            log_args.append(f"--since={since}")
+        commits_future = pool.submit(_run_git, log_args, cwd=config.grove_root)
+        branches_future = pool.submit(
+            _run_git, ["branch", "-a"], cwd=config.grove_root
+        )
+        prs_future = None
+        if _check_gh():
+            prs_future = pool.submit(
+                _run_gh,
+                [
+                    "pr",
+                    "list",
+                    "--state",
+                    "all",
+                    "--search",
+                    f"#{number}",
+                    *_limit_args("GROVE_GH_LIMIT_REFS", LIMIT_REFS),
+                ],
+                cwd=config.grove_root,
+            )
+        code_refs = code_future.result()
+        commits = commits_future.result()
+        branches = branches_future.result()
+
     # In code
     print_section("In Code", "")
-    code_refs = _run_rg(
-        [f"#{number}\\b", str(config.grove_root)], cwd=config.grove_root
-    )
     if code_refs.strip():
-        lines = code_refs.strip().split("\n")[:20]
-        console.print_raw("\n".join(lines))
+        # Take the display head without splitting the whole output
+        lines = list(islice(io.StringIO(code_refs), 20))
+        console.print_raw("".join(lines).rstrip("\n"))
     else:
         console.print(f"  No code references to #{number}")
 
     # In commits
     print_section("In Commits", "")
-    commits = _run_git(
-        ["log", "--oneline", "--all", f"--grep=#{number}"], cwd=config.grove_root
-    )
     if commits.strip():
-        lines = commits.strip().split("\n")[:15]
-        console.print_raw("\n".join(lines))
+        console.print_raw(commits.rstrip())
     else:
         console.print(f"  No commits mention #{number}")
 
     # In branches
     print_section("In Branches", "")
-    branches = _run_git(["branch", "-a"], cwd=config.grove_root)
     if branches:
-        related = [b.strip() for b in branches.split("\n") if str(number) in b]
+        num_re = re.compile(rf"(?<!\d){number}(?!\d)")
+        related = [b.strip() for b in branches.splitlines() if num_re.search(b)]
         if related:
             console.print_raw("\n".join(related))
         else:
             console.print(f"  No branches reference #{number}")
 
     # In PRs
-    if _check_gh():
+    if prs_future is not None:
         print_section("In Pull Requests", "")
-        output, success = _run_gh(
-            ["pr", "list", "--state", "all", "--search", f"#{number}", "--limit", "10"],
-            cwd=config.grove_root,
-        )
+        output, success = prs_future.result()
         if success and output.strip():
             console.print_raw(output.rstrip())
         else:
@@ -508,9 +895,11 @@ def link_cmd(
     commits = _run_git(
         ["log", "--oneline", "--all", "--", filepath], cwd=config.grove_root
     )
-    if commits.strip():
+    # splitlines() once; every check below works off the same list
+    commit_lines = commits.splitlines()
+    if commit_lines:
         # Filter to those mentioning issues
-        lines = [l for l in commits.strip().split("\n") if "#" in l][:20]
+        lines = [l for l in commit_lines if "#" in l][:20]
         if lines:
             console.print_raw("\n".join(lines))
         else:
@@ -520,26 +909,19 @@ def link_cmd(
 
     # Extract issue numbers
     print_section("Referenced Issues", "")
-    if commits.strip():
-        import re
-
-        issue_numbers = set(re.findall(r"#(\d+)", commits))
+    if commit_lines:
+        issue_numbers = {m.group(1) for m in _ISSUE_REF_RE.finditer(commits)}
         if issue_numbers and _check_gh():
-            for num in sorted(issue_numbers, key=int):
-                output, success = _run_gh(
-                    [
-                        "issue",
-                        "view",
-                        num,
-                        "--json",
-                        "number,title,state",
-                        "--jq",
-                        '"#\\(.number) [\\(.state)] \\(.title)"',
-                    ],
-                    cwd=config.grove_root,
-                )
-                if success and output.strip():
-                    console.print(f"  {output.strip()}")
+            # One batched lookup for all referenced issues, capped to
+            # keep the query size sane
+            nums = sorted(issue_numbers, key=int)[:50]
+            summaries = _fetch_issue_summaries(nums, cwd=config.grove_root)
+            if summaries:
+                for line in summaries:
+                    console.print(f"  {line}")
+            else:
+                for num in nums:
+                    console.print(f"  #{num}")
         elif issue_numbers:
             for num in sorted(issue_numbers, key=int):
                 console.print(f"  #{num}")
@@ -547,3 +929,10 @@ def link_cmd(
             console.print("  No issue references found in this file's history")
     else:
         console.print("  No issue references found")
+
+
+@app.command("cache-clear")
+def cache_clear_cmd() -> None:
+    """Clear cached GitHub responses."""
+    removed = gh_cache.clear()
+    console.print(f"Removed {removed} cached response(s)")
@@ -3,35 +3,197 @@
 Provides: gf todo, gf log, gf env, gf stats, gf briefing
 """
 
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+import json
+import re
+import subprocess
 import typer
 
 from grove_find.core.config import get_config
-from grove_find.core.tools import discover_tools, run_tool
+from grove_find.core.tools import discover_tools, iter_tool_lines, run_tool
 from grove_find.output import console, print_header, print_section, print_warning
 
 app = typer.Typer(help="Project health commands")
 
+# Paths the Hot Files tally ignores (generated or vendored churn);
+# bytes because the path list is parsed without decoding
+_HOT_EXCLUDE_RE = re.compile(rb"node_modules|pnpm-lock|dist")
+
+
+# Per-invocation cache of the fixed rg/fd flag tuples, keyed by output
+# mode. The helpers run dozens of times per briefing; the flags never
+# change within a process.
+_rg_base_memo: dict[bool, tuple[str, ...]] = {}
+_fd_base_memo: dict[bool, tuple[str, ...]] = {}
+
+
+def _rg_base(human: bool) -> tuple[str, ...]:
+    """Fixed rg flags (including excludes) for the given output mode."""
+    if human not in _rg_base_memo:
+        _rg_base_memo[human] = (
+            "--line-number",
+            "--no-heading",
+            "--smart-case",
+            "--color=always" if human else "--color=never",
+            "--glob",
+            "!node_modules",
+            "--glob",
+            "!.git",
+            "--glob",
+            "!dist",
+        )
+    return _rg_base_memo[human]
+
+
+def _fd_base(human: bool) -> tuple[str, ...]:
+    """Fixed fd flags for the given output mode."""
+    if human not in _fd_base_memo:
+        _fd_base_memo[human] = (
+            "--exclude",
+            "node_modules",
+            "--exclude",
+            "dist",
+            "--exclude",
+            ".git",
+            "--color=always" if human else "--color=never",
+        )
+    return _fd_base_memo[human]
+
+
+# Source extensions the scan commands target, and the glob they share
+_SRC_EXTS = ("ts", "js", "svelte")
+_SRC_GLOB = "*.{ts,js,svelte}"
+
+# Per-invocation cache of extension-presence probes, keyed by cwd
+_ext_probe_memo: dict[str, bool] = {}
+
+
+def _has_src_files(cwd: Path) -> bool:
+    """Whether any ts/js/svelte file exists under cwd (memoized).
+
+    On a backend-only tree every scan is guaranteed empty; one bounded
+    probe (first hit stops the walk) lets all of them skip the fork
+    entirely.
+    """
+    key = str(cwd)
+    if key in _ext_probe_memo:
+        return _ext_probe_memo[key]
+
+    tools = discover_tools()
+    found = False
+    if tools.fd:
+        ext_flags = [flag for ext in _SRC_EXTS for flag in ("-e", ext)]
+        result = run_tool(
+            tools.fd, [*_fd_base(False), "--max-results", "1", *ext_flags], cwd=cwd
+        )
+        found = bool(result.stdout.strip())
+    elif tools.rg:
+        listing = iter_tool_lines(
+            tools.rg,
+            [
+                "--files",
+                "--glob",
+                _SRC_GLOB,
+                "--glob",
+                "!node_modules",
+                "--glob",
+                "!.git",
+                "--glob",
+                "!dist",
+            ],
+            cwd=cwd,
+        )
+        try:
+            found = next(listing, None) is not None
+        finally:
+            listing.close()
+
+    _ext_probe_memo[key] = found
+    return found
+
+
+# Per-invocation cache of full scans, keyed by args and cwd. A one-shot
+# CLI run never repeats a scan, but composed helpers or REPL use would;
+# the second identical walk then comes back for free.
+_rg_memo: dict[tuple[tuple[str, ...], str], str] = {}
+_fd_memo: dict[tuple[tuple[str, ...], str], str] = {}
+
+
+def _line_count(s: str) -> int:
+    """Count non-empty output lines without materializing a list."""
+    s = s.rstrip()
+    return 0 if not s else s.count("\n") + 1
+
 
 def _run_rg(args: list[str], cwd: Path) -> str:
-    """Run ripgrep with standard options."""
+    """Run ripgrep with standard options (memoized per invocation)."""
     tools = discover_tools()
     if not tools.rg:
         raise typer.Exit(1)
 
-    config = get_config()
-    base_args = ["--line-number", "--no-heading", "--smart-case"]
-    excludes = ["--glob", "!node_modules", "--glob", "!.git", "--glob", "!dist"]
+    if _SRC_GLOB in args and not _has_src_files(cwd):
+        return ""
 
-    if config.is_human_mode:
-        base_args.append("--color=always")
-    else:
-        base_args.append("--color=never")
+    key = (tuple(args), str(cwd))
+    if key not in _rg_memo:
+        _rg_memo[key] = run_tool(tools.rg, _rg_full_args(args), cwd=cwd).stdout
+    return _rg_memo[key]
 
-    result = run_tool(tools.rg, base_args + excludes + args, cwd=cwd)
-    return result.stdout
+
+def _rg_full_args(args: list[str]) -> list[str]:
+    """Assemble the standard rg flag set around args."""
+    return [*_rg_base(get_config().is_human_mode), *args]
+
+
+def _iter_rg_lines(args: list[str], cwd: Path) -> Iterator[str]:
+    """Stream ripgrep match lines as they arrive."""
+    tools = discover_tools()
+    if not tools.rg:
+        raise typer.Exit(1)
+
+    if _SRC_GLOB in args and not _has_src_files(cwd):
+        return
+
+    yield from iter_tool_lines(tools.rg, _rg_full_args(args), cwd=cwd)
+
+
+def _run_rg_head(args: list[str], cwd: Path, limit: int) -> list[str]:
+    """Run ripgrep and return at most the first limit match lines.
+
+    Bounded read for display heads: rg is stopped once the cap is
+    reached instead of producing every match in the tree only for
+    Python to slice most of them away. --max-count bounds per-file
+    matches as a second line of defence.
+    """
+    tools = discover_tools()
+    if not tools.rg:
+        raise typer.Exit(1)
+
+    if _SRC_GLOB in args and not _has_src_files(cwd):
+        return []
+
+    proc = subprocess.Popen(
+        [str(tools.rg)] + _rg_full_args(["--max-count", "50", *args]),
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert proc.stdout is not None
+    try:
+        lines = [line.rstrip("\n") for line in islice(proc.stdout, limit)]
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+    return lines
 
 
 def _run_fd(args: list[str], cwd: Path) -> str:
@@ -40,16 +202,12 @@ def _run_fd(args: list[str], cwd: Path) -> str:
     if not tools.fd:
         return ""
 
-    config = get_config()
-    base_args = ["--exclude", "node_modules", "--exclude", "dist", "--exclude", ".git"]
-
-    if config.is_human_mode:
-        base_args.append("--color=always")
-    else:
-        base_args.append("--color=never")
-
-    result = run_tool(tools.fd, base_args + args, cwd=cwd)
-    return result.stdout
+    key = (tuple(args), str(cwd))
+    if key not in _fd_memo:
+        _fd_memo[key] = run_tool(
+            tools.fd, [*_fd_base(get_config().is_human_mode), *args], cwd=cwd
+        ).stdout
+    return _fd_memo[key]
 
 
 def _run_git(args: list[str], cwd: Path) -> str:
@@ -61,6 +219,82 @@ def _run_git(args: list[str], cwd: Path) -> str:
     return result.stdout
 
 
+def _iter_git_records(args: list[str], cwd: Path) -> Iterator[bytes]:
+    """Stream NUL-delimited records from a git -z command, as bytes.
+
+    The whole output never sits in memory at once, and Python-side
+    parsing overlaps with git still producing — same streamer the git
+    commands use for their path lists.
+    """
+    tools = discover_tools()
+    if not tools.git:
+        return
+
+    proc = subprocess.Popen(
+        [str(tools.git)] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    try:
+        buf = b""
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            records = (buf + chunk).split(b"\0")
+            buf = records.pop()
+            for record in records:
+                if record:
+                    yield record
+        if buf:
+            yield buf
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def _week_log_summary(cwd: Path) -> tuple[list[str], "Counter[bytes]"]:
+    """One streamed revwalk feeding two briefing sections.
+
+    Each commit arrives as a header record ("%h\x1f%ct\x1f%s" plus,
+    after a newline, its first path) followed by further NUL-delimited
+    paths. Returns up to five of yesterday's commits formatted for
+    display, and the Counter of paths changed this week; paths stay
+    bytes and only the printed ones are decoded.
+    """
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start_ts = int((midnight - timedelta(days=1)).timestamp())
+    end_ts = int(midnight.timestamp())
+
+    yesterday_lines: list[str] = []
+    file_counts: Counter[bytes] = Counter()
+    for record in _iter_git_records(
+        [
+            "log",
+            "--since=1 week ago",
+            "-z",
+            "--name-only",
+            "--pretty=format:%h%x1f%ct%x1f%s",
+        ],
+        cwd=cwd,
+    ):
+        if b"\x1f" in record:
+            header, _, record = record.partition(b"\n")
+            short, ct, subject = header.split(b"\x1f", 2)
+            try:
+                ts = int(ct)
+            except ValueError:
+                ts = 0
+            if start_ts <= ts < end_ts and len(yesterday_lines) < 5:
+                yesterday_lines.append(
+                    f"{short.decode()} {subject.decode(errors='replace')}"
+                )
+            if not record:
+                continue
+        if not _HOT_EXCLUDE_RE.search(record):
+            file_counts[record] += 1
+    return yesterday_lines, file_counts
+
+
 def _run_gh(args: list[str], cwd: Path) -> tuple[str, bool]:
     """Run gh command, returning (output, success)."""
     tools = discover_tools()
@@ -96,41 +330,41 @@ def todo_command(type_filter: Optional[str] = None) -> None:
     else:
         print_section("TODO/FIXME/HACK Comments", "")
 
-        # TODOs
-        print_section("TODOs", "")
-        output = _run_rg(
-            ["\\bTODO\\b:?", "--glob", "*.{ts,js,svelte}", str(config.grove_root)],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:20]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (none found)")
-
-        # FIXMEs
-        print_section("FIXMEs", "")
-        output = _run_rg(
-            ["\\bFIXME\\b:?", "--glob", "*.{ts,js,svelte}", str(config.grove_root)],
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:20]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (none found)")
-
-        # HACKs
-        print_section("HACKs", "")
-        output = _run_rg(
-            ["\\bHACK\\b:?", "--glob", "*.{ts,js,svelte}", str(config.grove_root)],
+        # One rg walk finds all three markers (rg takes repeated -e
+        # patterns); the lines are bucketed as they stream in, and the
+        # search stops early once every bucket is at its cap.
+        caps = {"TODO": 20, "FIXME": 20, "HACK": 10}
+        buckets: dict[str, list[str]] = {"TODO": [], "FIXME": [], "HACK": []}
+        marker_re = re.compile(r"(TODO|FIXME|HACK)")
+        for line in _iter_rg_lines(
+            [
+                "-e",
+                "\\bTODO\\b:?",
+                "-e",
+                "\\bFIXME\\b:?",
+                "-e",
+                "\\bHACK\\b:?",
+                "--glob",
+                "*.{ts,js,svelte}",
+                str(config.grove_root),
+            ],
             cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:10]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (none found)")
+        ):
+            match = marker_re.search(line)
+            if not match:
+                continue
+            bucket = buckets[match.group(1)]
+            if len(bucket) < caps[match.group(1)]:
+                bucket.append(line)
+                if all(len(buckets[m]) >= caps[m] for m in caps):
+                    break
+
+        for title, marker in (("TODOs", "TODO"), ("FIXMEs", "FIXME"), ("HACKs", "HACK")):
+            print_section(title, "")
+            if buckets[marker]:
+                console.print_raw("\n".join(buckets[marker]))
+            else:
+                console.print("  (none found)")
 
 
 @app.command("todo")
@@ -168,44 +402,42 @@ def log_command(level: Optional[str] = None) -> None:
     else:
         print_section("Console Statements", "")
 
-        # console.log
-        print_section("console.log", "")
-        output = _run_rg(
-            ["console\\.log\\(", "--glob", "*.{ts,js,svelte}", str(config.grove_root)]
-            + excludes,
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:20]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (none found)")
-
-        # console.error
-        print_section("console.error", "")
-        output = _run_rg(
-            ["console\\.error\\(", "--glob", "*.{ts,js,svelte}", str(config.grove_root)]
-            + excludes,
-            cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:15]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (none found)")
-
-        # console.warn
-        print_section("console.warn", "")
-        output = _run_rg(
-            ["console\\.warn\\(", "--glob", "*.{ts,js,svelte}", str(config.grove_root)]
+        # The three console levels share globs and excludes, so one rg
+        # walk serves them all; lines are bucketed by level as they
+        # stream in, stopping early once every bucket is at its cap
+        caps = {"log": 20, "error": 15, "warn": 10}
+        buckets: dict[str, list[str]] = {"log": [], "error": [], "warn": []}
+        level_re = re.compile(r"console\.(log|error|warn)\(")
+        for line in _iter_rg_lines(
+            [
+                "-e",
+                "console\\.log\\(",
+                "-e",
+                "console\\.error\\(",
+                "-e",
+                "console\\.warn\\(",
+                "--glob",
+                "*.{ts,js,svelte}",
+                str(config.grove_root),
+            ]
             + excludes,
             cwd=config.grove_root,
-        )
-        if output:
-            lines = output.strip().split("\n")[:10]
-            console.print_raw("\n".join(lines))
-        else:
-            console.print("  (none found)")
+        ):
+            match = level_re.search(line)
+            if not match:
+                continue
+            bucket = buckets[match.group(1)]
+            if len(bucket) < caps[match.group(1)]:
+                bucket.append(line)
+                if all(len(buckets[lv]) >= caps[lv] for lv in caps):
+                    break
+
+        for level_name in ("log", "error", "warn"):
+            print_section(f"console.{level_name}", "")
+            if buckets[level_name]:
+                console.print_raw("\n".join(buckets[level_name]))
+            else:
+                console.print("  (none found)")
 
         # debugger
         print_section("debugger statements", "")
@@ -233,22 +465,23 @@ def env_command(var: Optional[str] = None) -> None:
 
     if var:
         print_section(f"Environment variable: {var}", "")
-        output = _run_rg(
-            [var, "--glob", "*.{ts,js,svelte}", str(config.grove_root)],
+        # The env-keyword filter lives in the rg pattern itself (either
+        # order of keyword and var on the line), so only the lines that
+        # will actually print ever cross the pipe
+        escaped = re.escape(var)
+        pattern = (
+            rf"(?:env|process|import\.meta).*\b{escaped}\b"
+            rf"|\b{escaped}\b.*(?:env|process|import\.meta)"
+        )
+        lines = _run_rg_head(
+            [pattern, "--glob", "*.{ts,js,svelte}", str(config.grove_root)],
             cwd=config.grove_root,
+            limit=30,
         )
-        if output:
-            lines = [
-                l
-                for l in output.strip().split("\n")
-                if any(kw in l for kw in ["env", "process", "import.meta"])
-            ]
-            if lines:
-                console.print_raw("\n".join(lines[:30]))
-            else:
-                console.print("  (no env-related matches)")
+        if lines:
+            console.print_raw("\n".join(lines))
         else:
-            console.print("  (not found)")
+            console.print("  (no env-related matches)")
     else:
         print_section("Environment Variables", "")
 
@@ -264,7 +497,7 @@ def env_command(var: Optional[str] = None) -> None:
 
         # import.meta.env
         print_section("import.meta.env usage", "")
-        output = _run_rg(
+        lines = _run_rg_head(
             [
                 "import\\.meta\\.env\\.\\w+",
                 "--glob",
@@ -272,16 +505,16 @@ def env_command(var: Optional[str] = None) -> None:
                 str(config.grove_root),
             ],
             cwd=config.grove_root,
+            limit=20,
         )
-        if output:
-            lines = output.strip().split("\n")[:20]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # process.env
         print_section("process.env usage", "")
-        output = _run_rg(
+        lines = _run_rg_head(
             [
                 "process\\.env\\.\\w+",
                 "--type",
@@ -291,16 +524,16 @@ def env_command(var: Optional[str] = None) -> None:
                 str(config.grove_root),
             ],
             cwd=config.grove_root,
+            limit=15,
         )
-        if output:
-            lines = output.strip().split("\n")[:15]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # platform.env (Cloudflare)
         print_section("platform.env usage (Cloudflare)", "")
-        output = _run_rg(
+        lines = _run_rg_head(
             [
                 "platform\\.env\\.\\w+",
                 "--type",
@@ -310,16 +543,16 @@ def env_command(var: Optional[str] = None) -> None:
                 str(config.grove_root),
             ],
             cwd=config.grove_root,
+            limit=15,
         )
-        if output:
-            lines = output.strip().split("\n")[:15]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none found)")
 
         # wrangler.toml vars
         print_section("Env vars in wrangler.toml", "")
-        output = _run_rg(
+        lines = _run_rg_head(
             [
                 "\\[vars\\]",
                 "-A",
@@ -329,9 +562,9 @@ def env_command(var: Optional[str] = None) -> None:
                 str(config.grove_root),
             ],
             cwd=config.grove_root,
+            limit=20,
         )
-        if output:
-            lines = output.strip().split("\n")[:20]
+        if lines:
             console.print_raw("\n".join(lines))
         else:
             console.print("  (none configured)")
@@ -348,87 +581,119 @@ def env_cmd(
 def stats_command() -> None:
     """Show project git statistics."""
     config = get_config()
+    tools = discover_tools()
+    cwd = config.grove_root
 
     print_header("Project Git Stats Snapshot", "")
 
+    # Every query here is independent and read-only, so dispatch them
+    # all at once and print in order afterwards — wall time becomes the
+    # slowest call instead of the sum of a dozen
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        branch_future = pool.submit(_run_git, ["branch", "--show-current"], cwd)
+        total_future = pool.submit(_run_git, ["rev-list", "--count", "HEAD"], cwd)
+        # Plumbing for the pure counts: rev-list --count and
+        # for-each-ref produce the number (or a bare ref per line)
+        # instead of formatted log/branch output that only gets counted
+        # and thrown away
+        today_future = pool.submit(
+            _run_git, ["rev-list", "--count", "--since=midnight", "HEAD"], cwd
+        )
+        week_future = pool.submit(
+            _run_git, ["rev-list", "--count", "--since=1 week ago", "HEAD"], cwd
+        )
+        month_future = pool.submit(
+            _run_git, ["rev-list", "--count", "--since=1 month ago", "HEAD"], cwd
+        )
+        all_branches_future = pool.submit(
+            _run_git,
+            ["for-each-ref", "refs/heads", "refs/remotes", "--format=%(refname)"],
+            cwd,
+        )
+        local_future = pool.submit(
+            _run_git, ["for-each-ref", "refs/heads", "--format=%(refname)"], cwd
+        )
+        shortlog_future = pool.submit(_run_git, ["shortlog", "-sn", "--no-merges"], cwd)
+        tags_future = pool.submit(_run_git, ["tag"], cwd)
+        latest_tag_future = pool.submit(
+            _run_git, ["describe", "--tags", "--abbrev=0"], cwd
+        )
+        status_future = pool.submit(_run_git, ["status", "--short"], cwd)
+        stash_future = pool.submit(_run_git, ["stash", "list"], cwd)
+        if tools.has_gh:
+            # Let gh count server-side: --jq length returns the number
+            # instead of a formatted listing that only gets counted
+            prs_future = pool.submit(
+                _run_gh,
+                ["pr", "list", "--state", "open", "--json", "number", "--jq", "length"],
+                cwd,
+            )
+            issues_future = pool.submit(
+                _run_gh,
+                [
+                    "issue",
+                    "list",
+                    "--state",
+                    "open",
+                    "--json",
+                    "number",
+                    "--jq",
+                    "length",
+                ],
+                cwd,
+            )
+
     # Current branch
-    branch = _run_git(["branch", "--show-current"], cwd=config.grove_root).strip()
-    console.print(f"Current Branch: {branch}")
+    console.print(f"Current Branch: {branch_future.result().strip()}")
 
     # Commit stats
     print_section("Commit Stats", "")
-    total = _run_git(["rev-list", "--count", "HEAD"], cwd=config.grove_root).strip()
-    console.print(f"  Total commits: {total}")
-
-    today = _run_git(["log", "--oneline", "--since=midnight"], cwd=config.grove_root)
-    today_count = len(today.strip().split("\n")) if today.strip() else 0
-    console.print(f"  Today: {today_count}")
-
-    week = _run_git(["log", "--oneline", "--since=1 week ago"], cwd=config.grove_root)
-    week_count = len(week.strip().split("\n")) if week.strip() else 0
-    console.print(f"  This week: {week_count}")
+    console.print(f"  Total commits: {total_future.result().strip()}")
 
-    month = _run_git(["log", "--oneline", "--since=1 month ago"], cwd=config.grove_root)
-    month_count = len(month.strip().split("\n")) if month.strip() else 0
-    console.print(f"  This month: {month_count}")
+    console.print(f"  Today: {int(today_future.result().strip() or 0)}")
+    console.print(f"  This week: {int(week_future.result().strip() or 0)}")
+    console.print(f"  This month: {int(month_future.result().strip() or 0)}")
 
     # Branch stats
     print_section("Branch Stats", "")
-    all_branches = _run_git(["branch", "-a"], cwd=config.grove_root)
-    all_count = len(all_branches.strip().split("\n")) if all_branches.strip() else 0
-    console.print(f"  Total branches: {all_count}")
-
-    local = _run_git(["branch"], cwd=config.grove_root)
-    local_count = len(local.strip().split("\n")) if local.strip() else 0
-    console.print(f"  Local branches: {local_count}")
+    console.print(f"  Total branches: {_line_count(all_branches_future.result())}")
+    console.print(f"  Local branches: {_line_count(local_future.result())}")
 
     # Contributors
     print_section("Contributors", "")
-    shortlog = _run_git(["shortlog", "-sn", "--no-merges"], cwd=config.grove_root)
+    shortlog = shortlog_future.result()
     if shortlog:
         lines = shortlog.strip().split("\n")[:5]
         console.print_raw("\n".join(lines))
 
     # Tags
     print_section("Tag Stats", "")
-    tags = _run_git(["tag"], cwd=config.grove_root)
-    tag_count = len(tags.strip().split("\n")) if tags.strip() else 0
-    console.print(f"  Total tags: {tag_count}")
+    console.print(f"  Total tags: {_line_count(tags_future.result())}")
 
-    latest_tag = _run_git(
-        ["describe", "--tags", "--abbrev=0"], cwd=config.grove_root
-    ).strip()
+    latest_tag = latest_tag_future.result().strip()
     console.print(f"  Latest tag: {latest_tag or 'none'}")
 
     # GitHub stats
-    tools = discover_tools()
     if tools.has_gh:
         print_section("GitHub Stats (via gh)", "")
 
-        open_prs, _ = _run_gh(["pr", "list", "--state", "open"], cwd=config.grove_root)
-        pr_count = len(open_prs.strip().split("\n")) if open_prs.strip() else 0
-        console.print(f"  Open PRs: {pr_count}")
+        open_prs, _ = prs_future.result()
+        console.print(f"  Open PRs: {int(open_prs.strip() or 0)}")
 
-        open_issues, _ = _run_gh(
-            ["issue", "list", "--state", "open"], cwd=config.grove_root
-        )
-        issue_count = len(open_issues.strip().split("\n")) if open_issues.strip() else 0
-        console.print(f"  Open issues: {issue_count}")
+        open_issues, _ = issues_future.result()
+        console.print(f"  Open issues: {int(open_issues.strip() or 0)}")
     else:
         console.print("\nInstall GitHub CLI (gh) for PR/issue stats")
 
     # Working directory
     print_section("Working Directory", "")
-    status = _run_git(["status", "--short"], cwd=config.grove_root)
-    status_count = len(status.strip().split("\n")) if status.strip() else 0
+    status_count = _line_count(status_future.result())
     if status_count == 0:
         console.print("  Status: Clean")
     else:
         console.print(f"  Status: {status_count} uncommitted changes")
 
-    stashes = _run_git(["stash", "list"], cwd=config.grove_root)
-    stash_count = len(stashes.strip().split("\n")) if stashes.strip() else 0
-    console.print(f"  Stashes: {stash_count}")
+    console.print(f"  Stashes: {_line_count(stash_future.result())}")
 
 
 @app.command("stats")
@@ -440,84 +705,103 @@ def stats_cmd() -> None:
 def briefing_command() -> None:
     """Daily briefing with issues and TODOs."""
     config = get_config()
+    tools = discover_tools()
+    cwd = config.grove_root
 
     print_header("Daily Briefing", "")
 
     today = datetime.now().strftime("%A, %B %d, %Y")
     console.print(f"Date: {today}\n")
 
+    # Independent read-only queries: dispatch everything up front and
+    # render in order afterwards, same as stats_command
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        branch_future = pool.submit(_run_git, ["branch", "--show-current"], cwd)
+        uncommitted_future = pool.submit(_run_git, ["status", "--short"], cwd)
+        todo_future = pool.submit(
+            _run_rg_head,
+            [
+                "\\bTODO\\b",
+                "--glob",
+                "!*.md",
+                "--glob",
+                "*.{ts,js,svelte}",
+                str(cwd),
+            ],
+            cwd,
+            10,
+        )
+        # One streamed revwalk feeds both the Yesterday's Commits and
+        # Hot Files sections; the worker tallies while git produces
+        week_log_future = pool.submit(_week_log_summary, cwd)
+        if tools.has_gh:
+            # One gh call fetches the open-issue list with labels; the
+            # critical/high sections and the total are derived locally
+            # instead of paying three API round-trips
+            issues_future = pool.submit(
+                _run_gh,
+                [
+                    "issue",
+                    "list",
+                    "--state",
+                    "open",
+                    "--json",
+                    "number,title,labels",
+                    "--limit",
+                    "200",
+                ],
+                cwd,
+            )
+
     # Current status
     print_section("Current Status", "")
-    branch = _run_git(["branch", "--show-current"], cwd=config.grove_root).strip()
-    console.print(f"  Branch: {branch}")
+    console.print(f"  Branch: {branch_future.result().strip()}")
 
-    uncommitted = _run_git(["status", "--short"], cwd=config.grove_root)
-    uncommitted_count = (
-        len(uncommitted.strip().split("\n")) if uncommitted.strip() else 0
-    )
+    uncommitted_count = _line_count(uncommitted_future.result())
     if uncommitted_count > 0:
         console.print(f"  {uncommitted_count} uncommitted changes")
     else:
         console.print("  Working directory clean")
 
     # GitHub issues
-    tools = discover_tools()
     if tools.has_gh:
         print_section("Priority Issues", "")
 
-        # Critical
-        critical, _ = _run_gh(
-            [
-                "issue",
-                "list",
-                "--state",
-                "open",
-                "--label",
-                "priority-critical",
-                "--limit",
-                "5",
-            ],
-            cwd=config.grove_root,
-        )
-        if critical.strip():
+        raw_issues, ok = issues_future.result()
+        issues: list[dict] = []
+        if ok and raw_issues:
+            try:
+                issues = json.loads(raw_issues)
+            except json.JSONDecodeError:
+                issues = []
+
+        def _with_label(label: str) -> list[dict]:
+            return [
+                issue
+                for issue in issues
+                if any(lbl.get("name") == label for lbl in issue["labels"])
+            ][:5]
+
+        # Joined into one write per block: N tiny console.print calls
+        # each pay a render pass
+        critical = _with_label("priority-critical")
+        if critical:
             console.print("  CRITICAL:")
-            for line in critical.strip().split("\n"):
-                console.print(f"    {line}")
+            console.print_raw(
+                "\n".join(f"    #{i['number']} {i['title']}" for i in critical)
+            )
             console.print()
 
-        # High
-        high, _ = _run_gh(
-            [
-                "issue",
-                "list",
-                "--state",
-                "open",
-                "--label",
-                "priority-high",
-                "--limit",
-                "5",
-            ],
-            cwd=config.grove_root,
-        )
-        if high.strip():
+        high = _with_label("priority-high")
+        if high:
             console.print("  HIGH:")
-            for line in high.strip().split("\n"):
-                console.print(f"    {line}")
+            console.print_raw(
+                "\n".join(f"    #{i['number']} {i['title']}" for i in high)
+            )
             console.print()
 
-        # Count
-        open_issues, _ = _run_gh(
-            ["issue", "list", "--state", "open", "--json", "number"],
-            cwd=config.grove_root,
-        )
-        if open_issues:
-            import json
-
-            try:
-                count = len(json.loads(open_issues))
-                console.print(f"  Total open issues: {count}")
-            except json.JSONDecodeError:
-                pass
+        if ok:
+            console.print(f"  Total open issues: {len(issues)}")
         console.print("  View all: gh issue list --state open")
     else:
         console.print("\nGitHub CLI (gh) not available - install for issue tracking")
@@ -526,54 +810,30 @@ def briefing_command() -> None:
     print_section("Oldest TODO Comments in Code", "")
     console.print("  (These have been waiting the longest!)\n")
 
-    todo_output = _run_rg(
-        [
-            "\\bTODO\\b",
-            "--glob",
-            "!*.md",
-            "--glob",
-            "*.{ts,js,svelte}",
-            str(config.grove_root),
-        ],
-        cwd=config.grove_root,
-    )
-    if todo_output:
-        lines = todo_output.strip().split("\n")[:10]
-        for line in lines:
-            console.print(f"  {line[:100]}")
+    todo_lines = todo_future.result()
+    if todo_lines:
+        console.print_raw("\n".join(f"  {line[:100]}" for line in todo_lines))
     else:
         console.print("  No TODOs found!")
 
+    yesterday_lines, file_counts = week_log_future.result()
+
     # Yesterday's commits
     print_section("Yesterday's Commits", "")
-    yesterday = _run_git(
-        ["log", "--oneline", "--since=yesterday", "--until=midnight"],
-        cwd=config.grove_root,
-    )
-    if yesterday.strip():
-        lines = yesterday.strip().split("\n")[:5]
-        console.print_raw("\n".join(lines))
+    if yesterday_lines:
+        console.print_raw("\n".join(yesterday_lines))
     else:
         console.print("  No commits yesterday")
 
     # Hot files
     print_section("Hot Files (Changed This Week)", "")
-    week_files = _run_git(
-        ["log", "--since=1 week ago", "--name-only", "--pretty=format:"],
-        cwd=config.grove_root,
-    )
-    if week_files:
-        file_counts = {}
-        for line in week_files.strip().split("\n"):
-            line = line.strip()
-            if line and not any(
-                exc in line for exc in ["node_modules", "pnpm-lock", "dist"]
-            ):
-                file_counts[line] = file_counts.get(line, 0) + 1
-
-        sorted_files = sorted(file_counts.items(), key=lambda x: -x[1])[:10]
-        for f, count in sorted_files:
-            console.print(f"  {count} changes: {f}")
+    if file_counts:
+        console.print_raw(
+            "\n".join(
+                f"  {count} changes: {f.decode(errors='replace')}"
+                for f, count in file_counts.most_common(10)
+            )
+        )
     else:
         console.print("  No changes this week")
 
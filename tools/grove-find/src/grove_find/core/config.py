@@ -5,6 +5,7 @@ Handles GROVE_ROOT detection, output mode settings, and configuration precedence
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 import os
@@ -108,17 +109,28 @@ class Config:
             "Run from within a Grove project, or set GROVE_ROOT environment variable."
         )
 
-    @property
+    @cached_property
+    def root_str(self) -> str:
+        """grove_root as a string, computed once.
+
+        Commands pass the root to subprocesses constantly; this avoids
+        re-stringifying the Path on every call.
+        """
+        return str(self.grove_root)
+
+    # The mode predicates are cached: output_mode never changes after
+    # construction and the subprocess helpers check these on every call
+    @cached_property
     def is_agent_mode(self) -> bool:
         """Check if running in agent mode."""
         return self.output_mode == OutputMode.AGENT
 
-    @property
+    @cached_property
     def is_json_mode(self) -> bool:
         """Check if running in JSON mode."""
         return self.output_mode == OutputMode.JSON
 
-    @property
+    @cached_property
     def is_human_mode(self) -> bool:
         """Check if running in human-friendly mode."""
         return self.output_mode == OutputMode.HUMAN
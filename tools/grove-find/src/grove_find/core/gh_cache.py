@@ -0,0 +1,59 @@
+"""TTL disk cache for GitHub CLI responses.
+
+gh calls pay a process spawn plus an HTTPS round-trip against a
+rate-limited API, and the listing commands are re-run constantly with
+identical arguments. Responses are cached gzipped under
+~/.cache/grove-find/gh/ keyed by the argument list; a short TTL keeps
+results fresh while collapsing repeat invocations to a file read.
+"""
+
+from pathlib import Path
+from typing import Optional
+import gzip
+import hashlib
+import time
+
+_CACHE_DIR = Path.home() / ".cache" / "grove-find" / "gh"
+
+
+def _entry_path(key: str) -> Path:
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return _CACHE_DIR / f"{digest}.json.gz"
+
+
+def get(key: str, ttl: float) -> Optional[bytes]:
+    """Return the cached body for key if younger than ttl seconds.
+
+    Bodies stay as bytes end to end: JSON consumers parse them directly
+    and nothing pays a decode for data that is never shown verbatim.
+    """
+    if ttl <= 0:
+        return None
+    entry = _entry_path(key)
+    try:
+        if time.time() - entry.stat().st_mtime >= ttl:
+            return None
+        return gzip.decompress(entry.read_bytes())
+    except OSError:
+        return None
+
+
+def put(key: str, body: bytes) -> None:
+    """Store a response body for key (best-effort)."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _entry_path(key).write_bytes(gzip.compress(body))
+    except OSError:
+        pass
+
+
+def clear() -> int:
+    """Delete all cached responses, returning the number removed."""
+    removed = 0
+    try:
+        for entry in _CACHE_DIR.glob("*.json.gz"):
+            entry.unlink()
+            removed += 1
+    except OSError:
+        pass
+    return removed
@@ -0,0 +1,88 @@
+"""On-disk cache of git command output for grove-find.
+
+Listing commands are re-run constantly against an unchanged repo. Their
+output is cached under ~/.cache/grove-find/git/ keyed by HEAD, the
+mtime of .git/index, and the argument list — so any commit, checkout,
+or staging change invalidates naturally, and repeat invocations skip
+git entirely. A short TTL guards the few date-relative queries, and the
+directory is capped at a handful of entries with oldest-first eviction.
+"""
+
+from pathlib import Path
+from typing import Optional
+import hashlib
+import time
+
+from grove_find.core.tools import discover_tools, run_tool
+
+_CACHE_DIR = Path.home() / ".cache" / "grove-find" / "git"
+_MAX_ENTRIES = 10
+
+
+def _state_key(cwd: Path) -> Optional[str]:
+    """Fingerprint the repo state as HEAD sha plus index mtime."""
+    tools = discover_tools()
+    if not tools.git:
+        return None
+
+    head = run_tool(tools.git, ["rev-parse", "HEAD"], cwd=cwd).stdout.strip()
+    if not head:
+        return None
+
+    try:
+        index_mtime = (cwd / ".git" / "index").stat().st_mtime_ns
+    except OSError:
+        index_mtime = 0
+    return f"{head}:{index_mtime}"
+
+
+def _evict_old_entries() -> None:
+    """Drop the oldest cache files beyond the entry cap."""
+    try:
+        entries = sorted(
+            _CACHE_DIR.glob("*.txt"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+    except OSError:
+        return
+    for stale in entries[_MAX_ENTRIES:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def cached_run_git(args: list[str], cwd: Path, ttl: float = 300.0) -> str:
+    """Run git, serving from the disk cache when repo state is unchanged.
+
+    Args:
+        args: git arguments (as passed to run_tool)
+        cwd: repository root
+        ttl: maximum age in seconds before a hit is refreshed anyway
+
+    Returns:
+        The command's stdout, cached or fresh.
+    """
+    tools = discover_tools()
+    if not tools.git:
+        return ""
+
+    key = _state_key(cwd)
+    entry: Optional[Path] = None
+    if key is not None:
+        digest = hashlib.sha256("\0".join([key, *args]).encode()).hexdigest()[:32]
+        entry = _CACHE_DIR / f"{digest}.txt"
+        try:
+            if time.time() - entry.stat().st_mtime < ttl:
+                return entry.read_text()
+        except OSError:
+            pass
+
+    output = run_tool(tools.git, args, cwd=cwd).stdout
+    if entry is not None:
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            entry.write_text(output)
+            _evict_old_entries()
+        except OSError:
+            pass  # Cache is best-effort only
+    return output
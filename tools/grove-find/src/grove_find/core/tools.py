@@ -4,9 +4,12 @@ Locates ripgrep (rg), fd, git, and gh binaries, providing graceful
 error messages when tools are missing.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
+import json
+import os
 import shutil
 import subprocess
 
@@ -92,18 +95,78 @@ def _find_binary(name: str, alt_names: Optional[list[str]] = None) -> Optional[P
     return None
 
 
+# Process-level cache: tool discovery stats dozens of paths, and helper
+# functions call discover_tools() freely. Backed by a small on-disk cache
+# so repeated gf invocations skip the PATH walk entirely.
+_tools_cache: Optional[ToolPaths] = None
+
+_DISK_CACHE = Path.home() / ".cache" / "grove-find" / "tools.json"
+
+
+def _load_disk_cache() -> Optional[ToolPaths]:
+    """Load cached tool paths if still valid for the current PATH."""
+    try:
+        data = json.loads(_DISK_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if data.get("path_env") != os.environ.get("PATH", ""):
+        return None
+
+    paths = {}
+    for tool in ("rg", "fd", "git", "gh"):
+        value = data.get(tool)
+        if value is None:
+            paths[tool] = None
+        else:
+            candidate = Path(value)
+            if not candidate.is_file():
+                return None  # Stale cache — rediscover
+            paths[tool] = candidate
+    return ToolPaths(**paths)
+
+
+def _save_disk_cache(tools: ToolPaths) -> None:
+    """Persist discovered tool paths for future invocations."""
+    data = {
+        "path_env": os.environ.get("PATH", ""),
+        "rg": str(tools.rg) if tools.rg else None,
+        "fd": str(tools.fd) if tools.fd else None,
+        "git": str(tools.git) if tools.git else None,
+        "gh": str(tools.gh) if tools.gh else None,
+    }
+    try:
+        _DISK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _DISK_CACHE.write_text(json.dumps(data))
+    except OSError:
+        pass  # Cache is best-effort only
+
+
 def discover_tools() -> ToolPaths:
     """Discover all external tools.
 
+    Results are cached for the process lifetime, and on disk (keyed by
+    PATH) so repeated invocations skip binary discovery.
+
     Returns:
         ToolPaths with discovered tool locations
     """
-    return ToolPaths(
+    global _tools_cache
+    if _tools_cache is not None:
+        return _tools_cache
+
+    _tools_cache = _load_disk_cache()
+    if _tools_cache is not None:
+        return _tools_cache
+
+    _tools_cache = ToolPaths(
         rg=_find_binary("rg"),
         fd=_find_binary("fd", alt_names=["fdfind"]),  # Ubuntu uses fdfind
         git=_find_binary("git"),
         gh=_find_binary("gh"),
     )
+    _save_disk_cache(_tools_cache)
+    return _tools_cache
 
 
 def get_install_instructions() -> str:
@@ -159,3 +222,62 @@ def run_tool(
         text=True,
         check=check,
     )
+
+
+def run_tool_bytes(
+    tool_path: Path,
+    args: list[str],
+    cwd: Optional[Path] = None,
+) -> subprocess.CompletedProcess:
+    """Run an external tool capturing raw bytes.
+
+    For consumers that parse or filter the output (JSON, bytes regexes)
+    a str is wasted work: this skips the UTF-8 decode pass that
+    text=True performs over the whole stream.
+
+    Args:
+        tool_path: Path to the tool binary
+        args: Command-line arguments
+        cwd: Working directory (defaults to current)
+
+    Returns:
+        CompletedProcess with bytes stdout/stderr
+    """
+    return subprocess.run(
+        [str(tool_path)] + args,
+        cwd=cwd,
+        capture_output=True,
+        check=False,
+    )
+
+
+def iter_tool_lines(
+    tool_path: Path,
+    args: list[str],
+    cwd: Optional[Path] = None,
+) -> Iterator[str]:
+    """Run an external tool and yield stdout lines as they arrive.
+
+    Streaming alternative to run_tool for large outputs that are
+    aggregated line by line — peak memory stays at one line instead of
+    the whole output.
+
+    Args:
+        tool_path: Path to the tool binary
+        args: Command-line arguments
+        cwd: Working directory (defaults to current)
+    """
+    proc = subprocess.Popen(
+        [str(tool_path)] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert proc.stdout is not None
+    try:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+    finally:
+        proc.stdout.close()
+        proc.wait()
@@ -0,0 +1,57 @@
+"""In-process directory walking for grove-find.
+
+Last-resort fallback for the file-type searches when neither fd nor rg
+is on PATH. os.scandir is C-backed and each DirEntry carries its file
+type from the directory read itself, so classification needs no extra
+stat syscalls; excluded trees are pruned before descent.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+import os
+
+# Directories never worth descending into
+PRUNE_DIRS = frozenset({"node_modules", ".git", "dist"})
+
+
+def iter_files(
+    root: Path,
+    suffixes: tuple[str, ...] = (),
+) -> Iterator[str]:
+    """Yield file paths under root lazily, pruning PRUNE_DIRS.
+
+    Args:
+        root: Directory to walk
+        suffixes: If non-empty, only yield names ending in one of these
+            (include the leading dot, e.g. (".ts", ".js"))
+    """
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNE_DIRS:
+                            stack.append(entry.path)
+                    elif not suffixes or entry.name.endswith(suffixes):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def iter_dirs(root: Path) -> Iterator[tuple[str, str]]:
+    """Yield (name, path) for directories under root, pruning PRUNE_DIRS."""
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in PRUNE_DIRS:
+                            continue
+                        yield entry.name, entry.path
+                        stack.append(entry.path)
+        except OSError:
+            continue
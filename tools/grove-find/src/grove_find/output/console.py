@@ -52,8 +52,12 @@ class GroveFindConsole:
             self._console.print(*args, **kwargs)
 
     def print_raw(self, text: str) -> None:
-        """Print raw text without any formatting."""
-        print(text, file=sys.stdout)
+        """Print raw text without any formatting.
+
+        Bulk passthrough (rg/fd/git output) goes straight to stdout in a
+        single write — no Rich layout, no print() argument handling.
+        """
+        sys.stdout.write(text + "\n")
 
     @property
     def rich_console(self) -> Console: